@@ -2,6 +2,190 @@
 from AlgorithmImports import *
 # endregion
 
+import numpy as np
+
+try:
+    # Optional: compiles the tweak loop to machine code; cache=True keeps
+    # the compiled binary across backtest runs
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _nearest(strikes, target):
+    """Position of the strike nearest to target in a sorted array."""
+    n = strikes.shape[0]
+    j = np.searchsorted(strikes, target)
+    if j == 0:
+        return 0
+    if j == n:
+        return n - 1
+    return j if strikes[j] - target < target - strikes[j - 1] else j - 1
+
+
+def _respread(strikes, new_short_strike, spread_width, is_call):
+    """Re-derive (short, long) positions after moving the short strike."""
+    short = _nearest(strikes, new_short_strike)
+    if is_call:
+        long_ = _nearest(strikes, strikes[short] + spread_width)
+        if strikes[long_] <= strikes[short]:
+            return -1, -1
+    else:
+        long_ = _nearest(strikes, strikes[short] - spread_width)
+        if strikes[long_] >= strikes[short]:
+            return -1, -1
+    return short, long_
+
+
+def _tweak_core(
+    call_strikes,
+    call_deltas,
+    call_bids,
+    call_asks,
+    put_strikes,
+    put_deltas,
+    put_bids,
+    put_asks,
+    call_short,
+    call_long,
+    put_short,
+    put_long,
+    spread_width,
+    min_credit,
+    max_credit,
+    max_call_delta,
+    max_put_delta,
+    max_total_delta,
+    credit_balance_ratio,
+    delta_ratio,
+    max_attempts,
+):
+    """
+    Numeric core of the tweak loop: pure array reads and position moves.
+
+    Returns (call_short, call_long, put_short, put_long, tweaks), with
+    negative positions when no valid condor was found.
+    """
+    tweaks = 0
+    while tweaks < max_attempts:
+        tweaks += 1
+        call_price = round(call_bids[call_short] - call_asks[call_long], 2)
+        put_price = round(put_bids[put_short] - put_asks[put_long], 2)
+        call_delta = call_deltas[call_short]
+        put_delta = put_deltas[put_short]
+        strategy_price = call_price + put_price
+
+        # Check 1: Minimum credit -> move the weaker side toward ATM
+        if strategy_price < min_credit:
+            if call_price < put_price:
+                call_short, call_long = _respread(
+                    call_strikes, call_strikes[call_short] - 5.0, spread_width, True
+                )
+            else:
+                put_short, put_long = _respread(
+                    put_strikes, put_strikes[put_short] + 5.0, spread_width, False
+                )
+            if call_short < 0 or put_short < 0:
+                return -1, -1, -1, -1, tweaks
+            continue
+
+        # Check 2: Maximum credit -> move the richer side away from ATM
+        if strategy_price > max_credit:
+            if call_price > put_price:
+                call_short, call_long = _respread(
+                    call_strikes, call_strikes[call_short] + 5.0, spread_width, True
+                )
+            else:
+                put_short, put_long = _respread(
+                    put_strikes, put_strikes[put_short] - 5.0, spread_width, False
+                )
+            if call_short < 0 or put_short < 0:
+                return -1, -1, -1, -1, tweaks
+            continue
+
+        # Check 3: Call delta too high
+        if call_delta > max_call_delta:
+            call_short, call_long = _respread(
+                call_strikes, call_strikes[call_short] + 5.0, spread_width, True
+            )
+            if call_short < 0:
+                return -1, -1, -1, -1, tweaks
+            continue
+
+        # Check 4: Put delta too high
+        if put_delta > max_put_delta:
+            put_short, put_long = _respread(
+                put_strikes, put_strikes[put_short] - 5.0, spread_width, False
+            )
+            if put_short < 0:
+                return -1, -1, -1, -1, tweaks
+            continue
+
+        # Check 5: Total delta too high
+        if call_delta + put_delta > max_total_delta:
+            if call_delta > put_delta:
+                call_short, call_long = _respread(
+                    call_strikes, call_strikes[call_short] + 5.0, spread_width, True
+                )
+            else:
+                put_short, put_long = _respread(
+                    put_strikes, put_strikes[put_short] - 5.0, spread_width, False
+                )
+            if call_short < 0 or put_short < 0:
+                return -1, -1, -1, -1, tweaks
+            continue
+
+        # Check 6: Credit balance. smaller/larger < ratio rewritten as a
+        # multiply so the loop carries no FP divide (and no zero-divide
+        # when one side prices at exactly zero)
+        smaller = min(call_price, put_price)
+        larger = max(call_price, put_price)
+        if larger > 0.0 and smaller < larger * credit_balance_ratio:
+            if call_price < put_price:
+                call_short, call_long = _respread(
+                    call_strikes, call_strikes[call_short] - 5.0, spread_width, True
+                )
+            else:
+                put_short, put_long = _respread(
+                    put_strikes, put_strikes[put_short] + 5.0, spread_width, False
+                )
+            if call_short < 0 or put_short < 0:
+                return -1, -1, -1, -1, tweaks
+            continue
+
+        # Check 7: Delta balance, same divide-free form as check 6
+        smaller = min(call_delta, put_delta)
+        larger = max(call_delta, put_delta)
+        if larger > 0.0 and smaller < larger * delta_ratio:
+            if call_delta < put_delta:
+                call_short, call_long = _respread(
+                    call_strikes, call_strikes[call_short] - 5.0, spread_width, True
+                )
+                put_short, put_long = _respread(
+                    put_strikes, put_strikes[put_short] - 5.0, spread_width, False
+                )
+            else:
+                put_short, put_long = _respread(
+                    put_strikes, put_strikes[put_short] + 5.0, spread_width, False
+                )
+                call_short, call_long = _respread(
+                    call_strikes, call_strikes[call_short] + 5.0, spread_width, True
+                )
+            if call_short < 0 or put_short < 0:
+                return -1, -1, -1, -1, tweaks
+            continue
+
+        return call_short, call_long, put_short, put_long, tweaks
+
+    return -1, -1, -1, -1, tweaks
+
+
+if njit is not None:
+    _nearest = njit(cache=True)(_nearest)
+    _respread = njit(cache=True)(_respread)
+    _tweak_core = njit(cache=True)(_tweak_core)
+
+
 class IronCondorFinder:
     """
     Finds and constructs iron condor strategies based on configurable parameters.
@@ -34,47 +218,198 @@ class IronCondorFinder:
         self.delta_ratio = delta_ratio
         self.max_tweak_attempts = max_tweak_attempts
 
-    def find_iron_condor(self, contracts, spx_price):
+    @staticmethod
+    def build_chain_arrays(contracts):
+        """
+        Flatten a contract list into parallel NumPy arrays (SoA layout).
+
+        Built once per entry attempt so the tweak loop works with
+        vectorized comparisons and binary searches instead of rescanning
+        Python objects on every iteration. Deltas are stored as
+        absolute values; `contracts` is kept as the index->object table
+        for turning array positions back into legs.
+        """
+        if not contracts:
+            empty = np.empty(0)
+            return {
+                "contracts": contracts,
+                "strikes": empty,
+                "deltas": empty,
+                "bids": empty,
+                "asks": empty,
+                "is_call": np.empty(0, dtype=bool),
+            }
+
+        # One pass over the contract objects gathers all five fields;
+        # a column-per-fromiter layout would walk the list five times
+        rows = [
+            (c.strike, c.greeks.delta, c.bid_price, c.ask_price, c.right == OptionRight.CALL)
+            for c in contracts
+        ]
+        strikes, deltas, bids, asks, is_call = (
+            np.array(col) for col in zip(*rows)
+        )
+        return {
+            "contracts": contracts,
+            "strikes": strikes,
+            "deltas": np.abs(deltas),
+            "bids": bids,
+            "asks": asks,
+            "is_call": is_call.astype(bool),
+        }
+
+    @staticmethod
+    def _side_view(chain, side):
+        """Boolean-mask one side out of the chain arrays, sorted by strike
+        so leg lookups can binary-search instead of scanning."""
+        mask = chain["is_call"] if side == "CALL" else ~chain["is_call"]
+        idx = np.flatnonzero(mask)
+        idx = idx[np.argsort(chain["strikes"][idx], kind="stable")]
+        return {
+            "side": side,
+            "contracts": chain["contracts"],
+            "index": idx,
+            "strikes": chain["strikes"][idx],
+            "deltas": chain["deltas"][idx],
+            "bids": chain["bids"][idx],
+            "asks": chain["asks"][idx],
+        }
+
+    def find_iron_condor(self, contracts, spx_price, chain=None, relax=0):
         """
         Find a valid iron condor strategy from the given option chain.
 
         Args:
             contracts: List of option contracts
             spx_price: Current SPX price
+            chain: Optional precomputed arrays from build_chain_arrays;
+                built here when the caller has not done so already
+            relax: Relaxation step (0 = strict). Each step widens the
+                credit window, delta caps, and balance ratios by 25% so
+                retries within the same entry window can accept a condor
+                the strict pass rejected
 
         Returns:
             Tuple of (call_spread, put_spread, tweak_count) if valid strategy found, else None
         """
-        # Filter puts and calls
-        puts = sorted(
-            [x for x in contracts if x.right == OptionRight.PUT],
-            key=lambda x: x.strike,
-            reverse=True,
-        )
-        calls = sorted(
-            [x for x in contracts if x.right == OptionRight.CALL], key=lambda x: x.strike
-        )
-
-        if len(puts) < 2 or len(calls) < 2:
+        if chain is None:
+            chain = self.build_chain_arrays(contracts)
+
+        # The side views, straddle, and 2-sigma initial spreads depend only
+        # on the chain and spot, not on the relaxation step -- memoize them
+        # on the chain dict so retry attempts skip straight to the tweak
+        calls = chain.get("_calls_view")
+        if calls is None:
+            calls = chain["_calls_view"] = self._side_view(chain, "CALL")
+            chain["_puts_view"] = self._side_view(chain, "PUT")
+        puts = chain["_puts_view"]
+
+        if puts["strikes"].size < 2 or calls["strikes"].size < 2:
             return None
 
-        # Calculate straddle price for expected move
-        straddle_price = self.calculate_straddle_price(contracts, spx_price)
+        cached = chain.get("_initial")
+        if cached is not None and cached[0] == spx_price:
+            call_spread, put_spread = cached[1], cached[2]
+        else:
+            # Calculate straddle price for expected move
+            straddle_price = self._straddle_price(calls, puts, spx_price)
 
-        # Find initial strategy using 2-sigma strikes
-        call_spread = self.find_initial_spread(calls, spx_price, straddle_price, "CALL")
-        put_spread = self.find_initial_spread(puts, spx_price, straddle_price, "PUT")
+            # Find initial strategy using 2-sigma strikes
+            call_spread = self._initial_spread(calls, spx_price, straddle_price)
+            put_spread = self._initial_spread(puts, spx_price, straddle_price)
+            chain["_initial"] = (spx_price, call_spread, put_spread)
 
         if not call_spread or not put_spread:
             return None
 
         # Tweak strategy until valid
-        result = self.tweak_strategy(call_spread, put_spread, calls, puts)
+        result = self.tweak_strategy(call_spread, put_spread, calls, puts, relax=relax)
 
         return result
 
+    @staticmethod
+    def _nearest_pos(strikes, target):
+        """Position of the strike nearest to target in a sorted array.
+
+        O(log N) searchsorted plus a neighbor compare; ties break toward
+        the lower strike, matching a left-to-right argmin.
+        """
+        j = int(np.searchsorted(strikes, target))
+        if j == 0:
+            return 0
+        if j == strikes.size:
+            return int(strikes.size - 1)
+        return j if strikes[j] - target < target - strikes[j - 1] else j - 1
+
+    def find_partner(self, side_view, short_strike, width=None):
+        """
+        Locate the long leg one spread width away from a short strike.
+
+        Binary-searches the strike-sorted side arrays for
+        short_strike + width (calls) or short_strike - width (puts).
+
+        Returns:
+            Array position of the partner strike, or -1 when no strike
+            sits within $0.01 of the target.
+        """
+        if width is None:
+            width = self.spread_width
+        if side_view["side"] == "CALL":
+            target = short_strike + width
+        else:
+            target = short_strike - width
+
+        strikes = side_view["strikes"]
+        j = int(np.searchsorted(strikes, target))
+        for pos in (j - 1, j):
+            if 0 <= pos < strikes.size and abs(strikes[pos] - target) < 0.01:
+                return pos
+        return -1
+
+    @staticmethod
+    def _straddle_price(calls, puts, spx_price):
+        """ATM straddle price off the sorted side arrays: two binary
+        searches, no chain walk"""
+        call_atm = IronCondorFinder._nearest_pos(calls["strikes"], spx_price)
+        put_atm = IronCondorFinder._nearest_pos(puts["strikes"], spx_price)
+        return round(float(calls["asks"][call_atm] + puts["asks"][put_atm]))
+
+    def _make_spread(self, side_view, short_pos, long_pos):
+        """Assemble a spread dict from array positions on one side."""
+        contracts = side_view["contracts"]
+        return {
+            "short_leg": contracts[side_view["index"][short_pos]],
+            "long_leg": contracts[side_view["index"][long_pos]],
+            "price": round(float(side_view["bids"][short_pos] - side_view["asks"][long_pos]), 2),
+            "delta": float(side_view["deltas"][short_pos]),
+            "side": side_view["side"],
+        }
+
+    def _initial_spread(self, side_view, spx_price, straddle_price):
+        """Find initial spread at 2-sigma strike from the side arrays"""
+        if side_view["side"] == "CALL":
+            target_strike = spx_price + (2 * straddle_price)
+        else:
+            target_strike = spx_price - (2 * straddle_price)
+
+        # Round to nearest $5
+        target_strike = round(target_strike / 5) * 5
+
+        strikes = side_view["strikes"]
+
+        # Short leg at target strike, or nearest available
+        short_pos = self._nearest_pos(strikes, target_strike)
+
+        # Long leg (spread_width away) must exist
+        long_pos = self.find_partner(side_view, strikes[short_pos])
+        if long_pos < 0:
+            return None
+
+        return self._make_spread(side_view, short_pos, long_pos)
+
     def calculate_straddle_price(self, contracts, spx_price):
-        """Calculate ATM straddle price for expected move"""
+        """Calculate ATM straddle price for expected move (contract-list path,
+        kept for PositionRoller which works per-expiry on raw chains)"""
         call_atm = min(
             [c for c in contracts if c.right == OptionRight.CALL],
             key=lambda x: abs(x.strike - spx_price),
@@ -87,7 +422,8 @@ class IronCondorFinder:
         return round(call_atm.ask_price + put_atm.ask_price)
 
     def find_initial_spread(self, contracts, spx_price, straddle_price, side):
-        """Find initial spread at 2-sigma strike"""
+        """Find initial spread at 2-sigma strike (contract-list path,
+        kept for PositionRoller which works per-expiry on raw chains)"""
         if side == "CALL":
             target_strike = spx_price + (2 * straddle_price)
         else:
@@ -121,132 +457,105 @@ class IronCondorFinder:
             "side": side,
         }
 
-    def tweak_strategy(self, call_spread, put_spread, calls, puts):
-        """Iteratively tweak strategy until it meets all criteria"""
-        tweak_attempts = 0
-
-        while tweak_attempts < self.max_tweak_attempts:
-            tweak_attempts += 1
-            strategy_price = call_spread["price"] + put_spread["price"]
-
-            # Check 1: Minimum credit
-            if strategy_price < self.min_credit:
-                if call_spread["price"] < put_spread["price"]:
-                    call_spread = self.move_spread_toward_atm(call_spread, calls, 5)
-                else:
-                    put_spread = self.move_spread_toward_atm(put_spread, puts, 5)
-                continue
-
-            # Check 2: Maximum credit
-            if strategy_price > self.max_credit:
-                if call_spread["price"] > put_spread["price"]:
-                    call_spread = self.move_spread_away_from_atm(call_spread, calls, 5)
-                else:
-                    put_spread = self.move_spread_away_from_atm(put_spread, puts, 5)
-                continue
-
-            # Check 3: Call delta too high
-            if call_spread["delta"] > self.max_call_delta:
-                call_spread = self.move_spread_away_from_atm(call_spread, calls, 5)
-                continue
-
-            # Check 4: Put delta too high
-            if put_spread["delta"] > self.max_put_delta:
-                put_spread = self.move_spread_away_from_atm(put_spread, puts, 5)
-                continue
-
-            # Check 5: Total delta too high
-            total_delta = call_spread["delta"] + put_spread["delta"]
-            if total_delta > self.max_total_delta:
-                if call_spread["delta"] > put_spread["delta"]:
-                    call_spread = self.move_spread_away_from_atm(call_spread, calls, 5)
-                else:
-                    put_spread = self.move_spread_away_from_atm(put_spread, puts, 5)
-                continue
-
-            # Check 6: Credit balance
-            if not self.is_credit_balanced(call_spread["price"], put_spread["price"]):
-                if call_spread["price"] < put_spread["price"]:
-                    call_spread = self.move_spread_toward_atm(call_spread, calls, 5)
-                else:
-                    put_spread = self.move_spread_toward_atm(put_spread, puts, 5)
-                continue
-
-            # Check 7: Delta balance
-            if not self.is_delta_balanced(call_spread["delta"], put_spread["delta"]):
-                if call_spread["delta"] < put_spread["delta"]:
-                    call_spread = self.move_spread_toward_atm(call_spread, calls, 5)
-                    put_spread = self.move_spread_away_from_atm(put_spread, puts, 5)
-                else:
-                    put_spread = self.move_spread_toward_atm(put_spread, puts, 5)
-                    call_spread = self.move_spread_away_from_atm(call_spread, calls, 5)
-                continue
-
-            return (call_spread, put_spread, tweak_attempts)
-
-        return None
-
-    def move_spread_toward_atm(self, spread, contracts, points):
+    def tweak_strategy(self, call_spread, put_spread, calls, puts, relax=0):
+        """Iteratively tweak strategy until it meets all criteria.
+
+        The loop itself lives in the module-level _tweak_core kernel --
+        pure array reads and position moves, JIT-compiled when numba is
+        available -- so up to max_tweak_attempts iterations run without
+        touching a Python dict or contract object.
+        """
+        # Each relaxation step widens every acceptance window by 25%
+        widen = 1.0 + 0.25 * relax
+
+        call_short, call_long, put_short, put_long, tweak_attempts = _tweak_core(
+            calls["strikes"],
+            calls["deltas"],
+            calls["bids"],
+            calls["asks"],
+            puts["strikes"],
+            puts["deltas"],
+            puts["bids"],
+            puts["asks"],
+            self._nearest_pos(calls["strikes"], call_spread["short_leg"].strike),
+            self._nearest_pos(calls["strikes"], call_spread["long_leg"].strike),
+            self._nearest_pos(puts["strikes"], put_spread["short_leg"].strike),
+            self._nearest_pos(puts["strikes"], put_spread["long_leg"].strike),
+            float(self.spread_width),
+            self.min_credit / widen,
+            self.max_credit * widen,
+            self.max_call_delta * widen,
+            self.max_put_delta * widen,
+            self.max_total_delta * widen,
+            self.credit_balance_ratio / widen,
+            self.delta_ratio / widen,
+            self.max_tweak_attempts,
+        )
+
+        if call_short < 0:
+            return None
+
+        return (
+            self._make_spread(calls, call_short, call_long),
+            self._make_spread(puts, put_short, put_long),
+            tweak_attempts,
+        )
+
+    def move_spread_toward_atm(self, spread, side_view, points):
         """Move spread toward ATM (increases credit, increases delta)"""
         if spread["side"] == "CALL":
             new_short_strike = spread["short_leg"].strike - points
         else:
             new_short_strike = spread["short_leg"].strike + points
 
-        return self.find_spread_at_strike(contracts, new_short_strike, spread["side"])
+        return self.find_spread_at_strike(side_view, new_short_strike)
 
-    def move_spread_away_from_atm(self, spread, contracts, points):
+    def move_spread_away_from_atm(self, spread, side_view, points):
         """Move spread away from ATM (decreases credit, decreases delta)"""
         if spread["side"] == "CALL":
             new_short_strike = spread["short_leg"].strike + points
         else:
             new_short_strike = spread["short_leg"].strike - points
 
-        return self.find_spread_at_strike(contracts, new_short_strike, spread["side"])
+        return self.find_spread_at_strike(side_view, new_short_strike)
 
-    def find_spread_at_strike(self, contracts, short_strike, side):
+    def find_spread_at_strike(self, side_view, short_strike):
         """Find spread with given short strike (or nearest available)"""
-        if not contracts:
+        strikes = side_view["strikes"]
+        if strikes.size == 0:
             return None
 
-        # Find short leg at exact strike, or nearest if not available
-        short_leg = next((c for c in contracts if c.strike == short_strike), None)
-        if not short_leg:
-            short_leg = min(contracts, key=lambda x: abs(x.strike - short_strike))
+        # Nearest short and long legs via binary search over the
+        # strike-sorted side arrays instead of per-contract Python scans
+        short_pos = self._nearest_pos(strikes, short_strike)
 
-        # Calculate target long strike
-        if side == "CALL":
-            long_strike = short_leg.strike + self.spread_width
+        if side_view["side"] == "CALL":
+            long_strike = strikes[short_pos] + self.spread_width
         else:
-            long_strike = short_leg.strike - self.spread_width
+            long_strike = strikes[short_pos] - self.spread_width
 
-        # Find long leg at exact strike, or nearest if not available
-        long_leg = next((c for c in contracts if c.strike == long_strike), None)
-        if not long_leg:
-            long_leg = min(contracts, key=lambda x: abs(x.strike - long_strike))
+        long_pos = self._nearest_pos(strikes, long_strike)
 
         # Validate spread: long leg should be further from ATM than short leg
-        if side == "CALL" and long_leg.strike <= short_leg.strike:
+        if side_view["side"] == "CALL" and strikes[long_pos] <= strikes[short_pos]:
             return None
-        if side == "PUT" and long_leg.strike >= short_leg.strike:
+        if side_view["side"] == "PUT" and strikes[long_pos] >= strikes[short_pos]:
             return None
 
-        return {
-            "short_leg": short_leg,
-            "long_leg": long_leg,
-            "price": round(short_leg.bid_price - long_leg.ask_price, 2),
-            "delta": abs(short_leg.greeks.delta),
-            "side": side,
-        }
+        return self._make_spread(side_view, short_pos, long_pos)
 
-    def is_credit_balanced(self, call_credit, put_credit):
+    def is_credit_balanced(self, call_credit, put_credit, credit_balance_ratio=None):
         """Check if credits are balanced"""
+        if credit_balance_ratio is None:
+            credit_balance_ratio = self.credit_balance_ratio
         smaller = min(call_credit, put_credit)
         larger = max(call_credit, put_credit)
-        return (smaller / larger) >= self.credit_balance_ratio
+        return smaller >= larger * credit_balance_ratio
 
-    def is_delta_balanced(self, call_delta, put_delta):
+    def is_delta_balanced(self, call_delta, put_delta, delta_ratio=None):
         """Check if deltas are balanced"""
+        if delta_ratio is None:
+            delta_ratio = self.delta_ratio
         smaller = min(call_delta, put_delta)
         larger = max(call_delta, put_delta)
-        return (smaller / larger) >= self.delta_ratio
+        return smaller >= larger * delta_ratio
@@ -16,8 +16,8 @@ class PositionRoller:
     def attempt_roll_on_max_loss(self, trade):
         """Attempt to roll tested side on max loss instead of exiting"""
         spx_price = self.algorithm.securities[self.algorithm.spx].price
-        short_call_strike = self.algorithm.securities[trade["short_call"]].strike
-        short_put_strike = self.algorithm.securities[trade["short_put"]].strike
+        short_call_strike = self.algorithm.securities[trade.short_call].strike
+        short_put_strike = self.algorithm.securities[trade.short_put].strike
         
         tested_side, _, _ = determine_tested_side(spx_price, short_call_strike, short_put_strike)
 
@@ -26,8 +26,8 @@ class PositionRoller:
     def attempt_late_exit_roll(self, trade):
         """Exit untested side and roll tested side on 0DTE"""
         spx_price = self.algorithm.securities[self.algorithm.spx].price
-        short_call_strike = self.algorithm.securities[trade["short_call"]].strike
-        short_put_strike = self.algorithm.securities[trade["short_put"]].strike
+        short_call_strike = self.algorithm.securities[trade.short_call].strike
+        short_put_strike = self.algorithm.securities[trade.short_put].strike
         tested_side, _, _ = determine_tested_side(spx_price, short_call_strike, short_put_strike)
 
         return self.roll_for_side(trade, tested_side)
@@ -38,7 +38,7 @@ class PositionRoller:
         if not chain:
             return None
         
-        current_expiry = trade["expiry"].date()
+        current_expiry = trade.expiry.date()
         today = self.algorithm.time.date()
         one_week_out = today + timedelta(days=7)
         available_expiries = sorted(set([c.expiry.date() for c in chain if current_expiry < c.expiry.date() <= one_week_out]))
@@ -72,10 +72,10 @@ class PositionRoller:
             if not tested_spread or not untested_spread:
                 continue
             
-            current_tested_short_price = self.algorithm.securities[trade["short_call" if side == "call" else "short_put"]].ask_price
-            current_tested_long_price = self.algorithm.securities[trade["long_call" if side == "call" else "long_put"]].bid_price
-            current_untested_short_price = self.algorithm.securities[trade["short_put" if side == "call" else "short_call"]].ask_price
-            current_untested_long_price = self.algorithm.securities[trade["long_put" if side == "call" else "long_call"]].bid_price
+            current_tested_short_price = self.algorithm.securities[trade.short_call if side == "call" else trade.short_put].ask_price
+            current_tested_long_price = self.algorithm.securities[trade.long_call if side == "call" else trade.long_put].bid_price
+            current_untested_short_price = self.algorithm.securities[trade.short_put if side == "call" else trade.short_call].ask_price
+            current_untested_long_price = self.algorithm.securities[trade.long_put if side == "call" else trade.long_call].bid_price
             
             close_cost = (current_tested_short_price - current_tested_long_price) + (current_untested_short_price - current_untested_long_price)
             new_credit = tested_spread["price"] + untested_spread["price"]
@@ -92,10 +92,10 @@ class PositionRoller:
         tested_spread = best_spreads["tested"]
         untested_spread = best_spreads["untested"]
         
-        current_tested_short = trade["short_call"] if side == "call" else trade["short_put"]
-        current_tested_long = trade["long_call"] if side == "call" else trade["long_put"]
-        current_untested_short = trade["short_put"] if side == "call" else trade["short_call"]
-        current_untested_long = trade["long_put"] if side == "call" else trade["long_call"]
+        current_tested_short = trade.short_call if side == "call" else trade.short_put
+        current_tested_long = trade.long_call if side == "call" else trade.long_put
+        current_untested_short = trade.short_put if side == "call" else trade.short_call
+        current_untested_long = trade.long_put if side == "call" else trade.long_call
         
         legs = [
             Leg.create(current_tested_short, 1), Leg.create(current_tested_long, -1),
@@ -108,26 +108,34 @@ class PositionRoller:
         
         new_total_credit = tested_spread["price"] + untested_spread["price"]
         if side == "call":
-            trade["short_call"] = tested_spread["short_leg"].symbol
-            trade["long_call"] = tested_spread["long_leg"].symbol
-            trade["short_put"] = untested_spread["short_leg"].symbol
-            trade["long_put"] = untested_spread["long_leg"].symbol
-            trade["call_credit"] = round(tested_spread["price"], 2)
-            trade["put_credit"] = round(untested_spread["price"], 2)
+            trade.short_call = tested_spread["short_leg"].symbol
+            trade.long_call = tested_spread["long_leg"].symbol
+            trade.short_put = untested_spread["short_leg"].symbol
+            trade.long_put = untested_spread["long_leg"].symbol
+            trade.call_credit = round(tested_spread["price"], 2)
+            trade.put_credit = round(untested_spread["price"], 2)
         else:
-            trade["short_put"] = tested_spread["short_leg"].symbol
-            trade["long_put"] = tested_spread["long_leg"].symbol
-            trade["short_call"] = untested_spread["short_leg"].symbol
-            trade["long_call"] = untested_spread["long_leg"].symbol
-            trade["put_credit"] = round(tested_spread["price"], 2)
-            trade["call_credit"] = round(untested_spread["price"], 2)
+            trade.short_put = tested_spread["short_leg"].symbol
+            trade.long_put = tested_spread["long_leg"].symbol
+            trade.short_call = untested_spread["short_leg"].symbol
+            trade.long_call = untested_spread["long_leg"].symbol
+            trade.put_credit = round(tested_spread["price"], 2)
+            trade.call_credit = round(untested_spread["price"], 2)
         
-        trade["expiry"] = tested_spread["short_leg"].expiry
-        trade["entry_credit"] = round(new_total_credit, 2)
-        trade["cumulative_credit"] += round(new_total_credit, 2)
-        trade["profit_target"] = trade["cumulative_credit"] * 0.6
-        trade["max_loss"] = trade["cumulative_credit"] * -3.5
+        # Refresh the Security objects cached at entry so P&L reads keep
+        # pointing at the new legs
+        securities = self.algorithm.securities
+        for leg in ("short_call", "long_call", "short_put", "long_put"):
+            symbol = getattr(trade, leg)
+            setattr(trade, leg + "_sec", securities[symbol] if symbol in securities else None)
+
+        trade.expiry = tested_spread["short_leg"].expiry
+        trade.entry_credit = round(new_total_credit, 2)
+        trade.cumulative_credit += round(new_total_credit, 2)
+        trade.profit_target = trade.cumulative_credit * 0.6
+        trade.max_loss = trade.cumulative_credit * -3.5
         
-        self.algorithm.debug(f"ROLLED to {best_expiry}: TOTAL=${new_total_credit:.2f}")
+        if getattr(self.algorithm, "_debug_on", True):
+            self.algorithm.debug(f"ROLLED to {best_expiry}: TOTAL=${new_total_credit:.2f}")
         
         return trade
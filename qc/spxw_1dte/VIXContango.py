@@ -3,34 +3,63 @@ from AlgorithmImports import *
 class VIXContango:
     """Manages VIX term structure analysis for contango/backwardation"""
     
-    def __init__(self, algorithm):
+    def __init__(self, algorithm, verbose=False):
         self.algorithm = algorithm
         self.vix = algorithm.vix
         self.vix1d = algorithm.vix1d
         self.vix9d = algorithm.vix9d
-    
+        # The Security objects are stable once subscribed, so grab them
+        # here and skip the securities-map lookups on every check
+        self.vix_sec = algorithm.securities[self.vix]
+        self.vix1d_sec = algorithm.securities[self.vix1d]
+        self.vix9d_sec = algorithm.securities[self.vix9d]
+        # Term-structure debug lines fire daily; keep them opt-in so the
+        # f-string formatting cost is skipped in normal backtests
+        self.verbose = verbose
+        # The VIX feeds are hourly, so the contango decision is cached
+        # per hour boundary
+        self._cached_hour = None
+        self._cached_result = False
+
     def is_in_contango(self):
         """
         Check if VIX term structure is in contango
         Contango: VIX1D < VIX9D < VIX (30-day)
+
+        The three VIX subscriptions update at Resolution.HOUR, so the
+        decision cannot change between hour boundaries; repeat calls
+        within the same hour return the cached result without touching
+        the securities map.
+        """
+        now = self.algorithm.time.replace(minute=0, second=0, microsecond=0)
+        if now == self._cached_hour:
+            return self._cached_result
+        result = self._check_contango()
+        self._cached_hour = now
+        self._cached_result = result
+        return result
+
+    def _check_contango(self):
+        """Evaluate the term structure from current prices.
+
+        Reads shortest tenor first and short-circuits, so the common
+        backwardation path exits after two securities lookups and
+        formats no debug strings.
         """
         try:
-            vix_price = self.algorithm.securities[self.vix].price
-            vix1d_price = self.algorithm.securities[self.vix1d].price
-            vix9d_price = self.algorithm.securities[self.vix9d].price
-            
-            if not all([vix_price, vix1d_price, vix9d_price]):
-                self.algorithm.debug(f"Invalid VIX prices: VIX1D={vix1d_price}, VIX9D={vix9d_price}, VIX={vix_price}")
+            vix1d_price = self.vix1d_sec.price
+            if not vix1d_price:
+                return False
+            vix9d_price = self.vix9d_sec.price
+            if not vix9d_price or vix1d_price >= vix9d_price:
+                return False
+            vix_price = self.vix_sec.price
+            if not vix_price or vix9d_price >= vix_price:
                 return False
-            
-            is_contango = (vix1d_price < vix9d_price) and (vix9d_price < vix_price)
 
-            if is_contango:
+            if self.verbose:
                 self.algorithm.debug(f"VIX CONTANGO: VIX1D={vix1d_price:.2f} < VIX9D={vix9d_price:.2f} < VIX={vix_price:.2f}")
-                return True
-            else:
-                self.algorithm.debug(f"VIX BACKWARDATION: VIX1D={vix1d_price:.2f}, VIX9D={vix9d_price:.2f}, VIX={vix_price:.2f}")
-                return False
+            return True
         except Exception as e:
             self.algorithm.debug(f"Error checking VIX contango: {str(e)}")
             return False
@@ -41,9 +70,9 @@ class VIXContango:
         Returns dict with VIX prices and spreads
         """
         try:
-            vix_price = self.algorithm.securities[self.vix].price
-            vix1d_price = self.algorithm.securities[self.vix1d].price
-            vix9d_price = self.algorithm.securities[self.vix9d].price
+            vix_price = self.vix_sec.price
+            vix1d_price = self.vix1d_sec.price
+            vix9d_price = self.vix9d_sec.price
             
             return {
                 "vix_1d": vix1d_price,
@@ -1,9 +1,40 @@
 from AlgorithmImports import *
+from dataclasses import dataclass
+from itertools import compress
+
+import numpy as np
+
 from IronCondorFinder import IronCondorFinder
 from PositionRoller import PositionRoller
 from VIXContango import VIXContango
 from util import calculate_pnl, determine_tested_side
 
+
+@dataclass(slots=True)
+class TradeState:
+    """Open iron condor state.
+
+    Slotted attributes instead of a dict: the monitoring path reads these
+    4-8 times per tick, and slot offsets beat per-access key hashing.
+    """
+    entry_credit: float
+    call_credit: float
+    put_credit: float
+    cumulative_credit: float
+    profit_target: float
+    max_loss: float
+    long_put: object
+    short_put: object
+    short_call: object
+    long_call: object
+    long_put_sec: object
+    short_put_sec: object
+    short_call_sec: object
+    long_call_sec: object
+    expiry: object
+    entry_spx_price: float
+
+
 class SPXW1DTEIronCondor(QCAlgorithm):
     """1DTE SPX Iron Condor Strategy with rolling on max loss"""
     def initialize(self):
@@ -14,11 +45,15 @@ class SPXW1DTEIronCondor(QCAlgorithm):
 
         self.settings.seed_initial_prices = True
         self.set_warmup(10, Resolution.MINUTE)
+        # Run universe selection off the main data loop
+        self.universe_settings.asynchronous = True
         self.spx = self.add_index("SPX", Resolution.MINUTE).symbol
 
-        # Add SPXW index options (weeklys)
+        # Add SPXW index options (weeklys). 40 strikes either side covers
+        # the 2-sigma entry band plus the full tweak walk and spread width
+        # with margin; expirations stay at 10 days for the roll search
         self.option = self.add_index_option(self.spx, "SPXW", Resolution.MINUTE)
-        self.option.set_filter(lambda x: x.include_weeklys().expiration(0, 10).strikes(-60, 60))
+        self.option.set_filter(lambda x: x.include_weeklys().expiration(0, 10).strikes(-40, 40))
         self.spxw = self.option.symbol
 
         # Add VIX for expected move calculation
@@ -28,6 +63,7 @@ class SPXW1DTEIronCondor(QCAlgorithm):
 
         # Trade tracking
         self.trade = None
+        self._is_0dte_cached = False
         self.position_entered = False
         self.call_side_closed = False
         self.put_side_closed = False
@@ -57,56 +93,102 @@ class SPXW1DTEIronCondor(QCAlgorithm):
         self.max_search_attempts = 5
         self.require_vix_contango = True
 
+        # Gate for the f-string debug lines on the entry/exit/fill paths:
+        # Python formats f-strings eagerly, so with this off the hot
+        # handlers skip the string building entirely
+        self._debug_on = True
+
+        # One shared daily rule for both schedules instead of constructing
+        # a fresh rule object per schedule.on call
+        daily = self.date_rules.every_day(self.spx)
+
         # Schedule entry window
         self.schedule.on(
-            self.date_rules.every_day(self.spx),
+            daily,
             self.time_rules.at(15, 55, TimeZones.NEW_YORK),
             self.check_entry
         )
 
-        # Monitor positions every 5 minutes
+        # Safety sweep only: monitoring is event-driven off leg quote
+        # updates in on_data, so the timer just catches quiet tape
         self.schedule.on(
-            self.date_rules.every_day(self.spx),
-            self.time_rules.every(timedelta(minutes=5)),
+            daily,
+            self.time_rules.every(timedelta(minutes=30)),
             self.monitor_positions,
         )
 
+        # Refresh the cached 0DTE flag once per day rather than comparing
+        # dates on every monitoring tick
+        self.schedule.on(
+            daily,
+            self.time_rules.at(0, 1, TimeZones.NEW_YORK),
+            self._refresh_0dte_flag,
+        )
+
     def check_entry(self):
         if self.is_warming_up or self.position_entered:
             return
 
         if self.require_vix_contango and not self.vix_contango.is_in_contango():
             return
-        
-        self.search_and_enter_iron_condor()
-    
-    def search_and_enter_iron_condor(self, attempt=0):
-        if attempt >= self.max_search_attempts:
-            return
+
+        # Hoisted once per entry check; previously tomorrow.date() was
+        # re-evaluated inside the chain filter for every contract
+        tomorrow_date = (self.time + timedelta(days=1)).date()
+        self.search_and_enter_iron_condor(tomorrow_date)
+
+    def search_and_enter_iron_condor(self, tomorrow_date):
         chain = self.current_slice.option_chains.get(self.spxw)
         if not chain:
             return
-        tomorrow = self.time + timedelta(days=1)
-        contracts = [x for x in chain if x.expiry.date() == tomorrow.date()]
+        # One pass packs each expiry into a comparable yyyymmdd int; the
+        # vectorized mask plus compress then selects tomorrow's contracts
+        # without re-running three Python comparisons per element
+        chain_list = list(chain)
+        expiry_keys = np.fromiter(
+            (c.expiry.year * 10000 + c.expiry.month * 100 + c.expiry.day for c in chain_list),
+            dtype=np.int32,
+            count=len(chain_list),
+        )
+        key = tomorrow_date.year * 10000 + tomorrow_date.month * 100 + tomorrow_date.day
+        contracts = list(compress(chain_list, expiry_keys == key))
         if not contracts:
             return
         spx_price = self.securities[self.spx].price
-        result = self.iron_condor_finder.find_iron_condor(contracts, spx_price)
+
+        # One pass over the chain into parallel NumPy arrays; the finder's
+        # tweak loop then works with vectorized comparisons instead of
+        # rescanning contract objects on every attempt
+        chain_arrays = self.iron_condor_finder.build_chain_arrays(contracts)
+
+        # Retry in-process with progressively relaxed thresholds: the chain
+        # does not change within this call, so re-running the finder only
+        # pays off when the acceptance window moves
+        result = None
+        for attempt in range(self.max_search_attempts):
+            result = self.iron_condor_finder.find_iron_condor(
+                contracts, spx_price, chain=chain_arrays, relax=attempt
+            )
+            if result:
+                break
 
         if result:
             call_spread, put_spread, tweak_count = result
+            if attempt > 0 and self._debug_on:
+                self.debug(f"Entry found after relaxing thresholds (step {attempt})")
             self.enter_position(call_spread, put_spread, spx_price)
         else:
             self.debug("No trade found. Skipping entry.")
 
     def enter_position(self, call_spread, put_spread, spx_price):
         total_credit = call_spread["price"] + put_spread["price"]
-        self.debug(
-            f"ENTRY: SPX={spx_price:.2f} "
-            f"CALL={call_spread['short_leg'].strike}/{call_spread['long_leg'].strike} "
-            f"PUT={put_spread['short_leg'].strike}/{put_spread['long_leg'].strike} "
-            f"TOTAL=${total_credit:.2f}"
-        )
+        if self._debug_on:
+            self.debug(
+                f"ENTRY: SPX={spx_price:.2f} "
+                f"CALL={call_spread['short_leg'].strike}/{call_spread['long_leg'].strike} "
+                f"PUT={put_spread['short_leg'].strike}/{put_spread['long_leg'].strike} "
+                f"TOTAL=${total_credit:.2f}"
+            )
 
         legs = [
             Leg.create(put_spread["long_leg"].symbol, 1),
@@ -116,91 +198,149 @@ class SPXW1DTEIronCondor(QCAlgorithm):
         ]
         self.combo_market_order(legs, 1)
 
-        self.trade = {
-            "entry_credit": round(total_credit, 2),
-            "call_credit": round(call_spread["price"], 2),
-            "put_credit": round(put_spread["price"], 2),
-            "cumulative_credit": round(total_credit, 2),
-            "profit_target": total_credit * 0.6,
-            "max_loss": total_credit * -3.5,
-            "long_put": put_spread["long_leg"].symbol,
-            "short_put": put_spread["short_leg"].symbol,
-            "short_call": call_spread["short_leg"].symbol,
-            "long_call": call_spread["long_leg"].symbol,
-            "expiry": call_spread["short_leg"].expiry,
-            "entry_spx_price": round(spx_price, 2),
-        }
+        self.trade = TradeState(
+            entry_credit=round(total_credit, 2),
+            call_credit=round(call_spread["price"], 2),
+            put_credit=round(put_spread["price"], 2),
+            cumulative_credit=round(total_credit, 2),
+            profit_target=total_credit * 0.6,
+            max_loss=total_credit * -3.5,
+            long_put=put_spread["long_leg"].symbol,
+            short_put=put_spread["short_leg"].symbol,
+            short_call=call_spread["short_leg"].symbol,
+            long_call=call_spread["long_leg"].symbol,
+            # Pre-resolved Security objects so the monitoring loop reads
+            # .price directly instead of re-probing self.securities four
+            # times per P&L check
+            long_put_sec=self.securities[put_spread["long_leg"].symbol],
+            short_put_sec=self.securities[put_spread["short_leg"].symbol],
+            short_call_sec=self.securities[call_spread["short_leg"].symbol],
+            long_call_sec=self.securities[call_spread["long_leg"].symbol],
+            expiry=call_spread["short_leg"].expiry,
+            entry_spx_price=round(spx_price, 2),
+        )
         self.position_entered = True
         self.call_side_closed = False
         self.put_side_closed = False
         self._pending_call_side_close = False
         self._pending_put_side_close = False
+        self._refresh_trade_targets()
+
+    def _refresh_trade_targets(self):
+        """Cache profit target / max loss as attributes so monitor_positions
+        compares against locals instead of probing the trade dict every tick"""
+        self._profit_target = self.trade.profit_target
+        self._max_loss = self.trade.max_loss
+        self._leg_symbols = (
+            self.trade.short_put,
+            self.trade.long_put,
+            self.trade.short_call,
+            self.trade.long_call,
+        )
+        self._refresh_0dte_flag()
+
+    def _snapshot_quotes(self):
+        """Gather the four exit-relevant leg quotes in one pass:
+        [short_put.bid, long_put.ask, short_call.bid, long_call.ask].
+        Returns None when any leg Security is missing from the cache."""
+        t = self.trade
+        legs = (t.short_put_sec, t.long_put_sec, t.short_call_sec, t.long_call_sec)
+        if None in legs:
+            return None
+        return np.array(
+            [legs[0].bid_price, legs[1].ask_price, legs[2].bid_price, legs[3].ask_price]
+        )
+
+    def _refresh_0dte_flag(self):
+        """Recompute the cached 0DTE flag; runs daily pre-open and whenever
+        a position is entered or rolled"""
+        self._is_0dte_cached = (
+            self.trade is not None and self.trade.expiry.date() == self.time.date()
+        )
+
+    def on_data(self, data):
+        """Recompute P&L when one of the four leg quotes updates instead of
+        waiting for the timer: fewer invocations on quiet tape, immediate
+        reaction when 0DTE gamma moves the legs"""
+        if self.is_warming_up or not self.position_entered or not self.trade:
+            return
+
+        quote_bars = data.quote_bars
+        if any(sym in quote_bars for sym in self._leg_symbols):
+            self.monitor_positions()
 
     def monitor_positions(self):
         if self.is_warming_up or not self.position_entered or not self.trade:
             return
 
-        if self.is_0dte() and self.time.hour < 9:
+        if self._is_0dte_cached and self.time.hour < 9:
             return
 
         current_pnl = calculate_pnl(self.trade, self.securities, self.call_side_closed, self.put_side_closed)
-        if current_pnl >= self.trade["profit_target"]:
-            self.exit_position("Profit target reached")
+        # Fold the two target checks into one signed comparison pair: the
+        # common no-breach tick evaluates both bounds and takes no branch
+        breach = (current_pnl >= self._profit_target) - (current_pnl <= self._max_loss)
+        if breach:
+            if breach > 0:
+                self.exit_position("Profit target reached")
+            else:
+                self.attempt_roll_on_max_loss()
             return
 
-        if current_pnl <= self.trade["max_loss"]:
-            self.attempt_roll_on_max_loss()
-            return
-        
-        if self.is_0dte():
+        if self._is_0dte_cached:
             chain = self.current_slice.option_chains.get(self.spxw)
             if not chain:
                 return
             
-            short_call_contract = next((c for c in chain if c.symbol == self.trade["short_call"]), None)
-            short_put_contract = next((c for c in chain if c.symbol == self.trade["short_put"]), None)
+            short_call_contract = next((c for c in chain if c.symbol == self.trade.short_call), None)
+            short_put_contract = next((c for c in chain if c.symbol == self.trade.short_put), None)
             
             short_call_delta = abs(short_call_contract.greeks.delta) if short_call_contract else 0
             short_put_delta = abs(short_put_contract.greeks.delta) if short_put_contract else 0
             
-            # Only check prices for sides that exist in current securities and haven't been closed
+            # Only check prices for sides that haven't been closed; one
+            # quote snapshot covers both sides instead of four separate
+            # securities probes
             call_buyback_cost = float('inf')
-            if not self.call_side_closed and self.trade["short_call"] in self.securities and self.trade["long_call"] in self.securities:
-                short_call_price = self.securities[self.trade["short_call"]].bid_price
-                long_call_price = self.securities[self.trade["long_call"]].ask_price
-                call_buyback_cost = short_call_price - long_call_price
-            
             put_buyback_cost = float('inf')
-            if not self.put_side_closed and self.trade["short_put"] in self.securities and self.trade["long_put"] in self.securities:
-                short_put_price = self.securities[self.trade["short_put"]].bid_price
-                long_put_price = self.securities[self.trade["long_put"]].ask_price
-                put_buyback_cost = short_put_price - long_put_price
+            quotes = self._snapshot_quotes()
+            if quotes is not None:
+                if not self.call_side_closed:
+                    call_buyback_cost = quotes[2] - quotes[3]
+                if not self.put_side_closed:
+                    put_buyback_cost = quotes[0] - quotes[1]
             
             if call_buyback_cost <= 0.20 and call_buyback_cost != float('inf') and not self.call_side_closed:
-                self.debug(f"Call spread buyback cost ${call_buyback_cost:.2f} <= 0.20, exiting call side")
+                if self._debug_on:
+                    self.debug(f"Call spread buyback cost ${call_buyback_cost:.2f} <= 0.20, exiting call side")
                 self.exit_call_side("Call spread cheap buyback")
             
             if put_buyback_cost <= 0.20 and put_buyback_cost != float('inf') and not self.put_side_closed:
-                self.debug(f"Put spread buyback cost ${put_buyback_cost:.2f} <= 0.20, exiting put side")
+                if self._debug_on:
+                    self.debug(f"Put spread buyback cost ${put_buyback_cost:.2f} <= 0.20, exiting put side")
                 self.exit_put_side("Put spread cheap buyback")
             
             if short_call_delta > 0.30 and not self.call_side_closed:
-                self.debug(f"Call short delta {short_call_delta:.3f} > 0.30, rolling call side")
+                if self._debug_on:
+                    self.debug(f"Call short delta {short_call_delta:.3f} > 0.30, rolling call side")
                 if not self.put_side_closed:
                     self.exit_put_side("Rolling call side - exit put side")
                 rolled = self.position_roller.roll_for_side(self.trade, "call")
                 if rolled:
                     self.trade = rolled
+                    self._refresh_trade_targets()
                     self._pending_call_side_close = False
                     self._pending_put_side_close = False
             
             if short_put_delta > 0.30 and not self.put_side_closed:
-                self.debug(f"Put short delta {short_put_delta:.3f} > 0.30, rolling put side")
+                if self._debug_on:
+                    self.debug(f"Put short delta {short_put_delta:.3f} > 0.30, rolling put side")
                 if not self.call_side_closed:
                     self.exit_call_side("Rolling put side - exit call side")
                 rolled = self.position_roller.roll_for_side(self.trade, "put")
                 if rolled:
                     self.trade = rolled
+                    self._refresh_trade_targets()
                     self._pending_call_side_close = False
                     self._pending_put_side_close = False
 
@@ -209,6 +349,7 @@ class SPXW1DTEIronCondor(QCAlgorithm):
 
         if new_trade:
             self.trade = new_trade
+            self._refresh_trade_targets()
             self.call_side_closed = False
             self.put_side_closed = False
             self._pending_call_side_close = False
@@ -217,15 +358,16 @@ class SPXW1DTEIronCondor(QCAlgorithm):
             self.exit_position("Max loss - roll failed")
 
     def is_0dte(self):
-        return self.trade and self.trade["expiry"].date() == self.time.date()
+        return self._is_0dte_cached
     
     def exit_call_side(self, reason):
         if self.call_side_closed or self._pending_call_side_close:
             return
             
-        legs = [Leg.create(self.trade["short_call"], 1), Leg.create(self.trade["long_call"], -1)]
+        legs = [Leg.create(self.trade.short_call, 1), Leg.create(self.trade.long_call, -1)]
         
-        self.debug(f"CALL EXIT ORDERED: {reason}")
+        if self._debug_on:
+            self.debug(f"CALL EXIT ORDERED: {reason}")
         self.combo_market_order(legs, 1)
         
         self._pending_call_side_close = True
@@ -233,9 +375,10 @@ class SPXW1DTEIronCondor(QCAlgorithm):
     def exit_put_side(self, reason):
         if self.put_side_closed or self._pending_put_side_close:
             return
-        legs = [Leg.create(self.trade["short_put"], 1), Leg.create(self.trade["long_put"], -1)]
+        legs = [Leg.create(self.trade.short_put, 1), Leg.create(self.trade.long_put, -1)]
         
-        self.debug(f"PUT EXIT ORDERED: {reason}")
+        if self._debug_on:
+            self.debug(f"PUT EXIT ORDERED: {reason}")
         self.combo_market_order(legs, 1)
         
         self._pending_put_side_close = True
@@ -245,13 +388,14 @@ class SPXW1DTEIronCondor(QCAlgorithm):
             return
         legs = []
 
-        self.debug(f"EXIT ORDERED: {reason}")
+        if self._debug_on:
+            self.debug(f"EXIT ORDERED: {reason}")
 
         if not self.put_side_closed:
-            legs.extend([Leg.create(self.trade["long_put"], -1), Leg.create(self.trade["short_put"], 1)])
+            legs.extend([Leg.create(self.trade.long_put, -1), Leg.create(self.trade.short_put, 1)])
 
         if not self.call_side_closed:
-            legs.extend([Leg.create(self.trade["short_call"], 1), Leg.create(self.trade["long_call"], -1)])
+            legs.extend([Leg.create(self.trade.short_call, 1), Leg.create(self.trade.long_call, -1)])
         
         if legs:
             self.combo_market_order(legs, 1)
@@ -260,6 +404,7 @@ class SPXW1DTEIronCondor(QCAlgorithm):
 
         self.position_entered = False
         self.trade = None
+        self._is_0dte_cached = False
         self.call_side_closed = False
         self.put_side_closed = False
         self._pending_call_side_close = False
@@ -271,20 +416,23 @@ class SPXW1DTEIronCondor(QCAlgorithm):
             fill_price = order_event.fill_price
             quantity = order_event.quantity
             symbol = order_event.symbol
-            self.debug(f"ORDER FILLED: {symbol} | Qty: {quantity} | Fill Price: ${fill_price:.4f}")
+            if self._debug_on:
+                self.debug(f"ORDER FILLED: {symbol} | Qty: {quantity} | Fill Price: ${fill_price:.4f}")
 
             if not self.trade:
                 return
 
             # Check if this is a call side closure
-            if self._pending_call_side_close and symbol in [self.trade["short_call"], self.trade["long_call"]]:
+            if self._pending_call_side_close and symbol in [self.trade.short_call, self.trade.long_call]:
                 self.call_side_closed = True
-                self.debug(f"CALL SIDE CLOSED (order filled)")
+                if self._debug_on:
+                    self.debug(f"CALL SIDE CLOSED (order filled)")
 
             # Check if this is a put side closure
-            if self._pending_put_side_close and symbol in [self.trade["short_put"], self.trade["long_put"]]:
+            if self._pending_put_side_close and symbol in [self.trade.short_put, self.trade.long_put]:
                 self.put_side_closed = True
-                self.debug(f"PUT SIDE CLOSED (order filled)")
+                if self._debug_on:
+                    self.debug(f"PUT SIDE CLOSED (order filled)")
 
             # Reset pending flags if both legs of a side are filled
             if self.call_side_closed:
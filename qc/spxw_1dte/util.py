@@ -2,6 +2,12 @@
 from AlgorithmImports import *
 # endregion
 
+import numpy as np
+
+# Exit cost of the full condor is short minus long on each side:
+# [short_put, long_put, short_call, long_call] . [1, -1, 1, -1]
+_EXIT_WEIGHTS = np.array([1.0, -1.0, 1.0, -1.0])
+
 def calculate_straddle_price(contracts, spx_price):
     """Calculate ATM straddle price for expected move"""
     # Find ATM contracts
@@ -53,48 +59,68 @@ def is_credit_balanced(call_credit, put_credit, credit_balance_ratio):
         """Check if credits are balanced"""
         smaller = min(call_credit, put_credit)
         larger = max(call_credit, put_credit)
-        return (smaller / larger) >= credit_balance_ratio
+        return smaller >= larger * credit_balance_ratio
     
 def is_delta_balanced(call_delta, put_delta, delta_ratio):
     """Check if deltas are balanced"""
     smaller = min(call_delta, put_delta)
     larger = max(call_delta, put_delta)
-    return (smaller / larger) >= delta_ratio
+    return smaller >= larger * delta_ratio
 
 def calculate_pnl(trade, securities, call_side_closed, put_side_closed):
     """Calculate current P&L"""
-    call_pnl = (
-        calculate_call_side_pnl(trade, securities, call_side_closed)
-        if not call_side_closed
-        else trade["call_credit"]
+    if call_side_closed or put_side_closed:
+        call_pnl = (
+            calculate_call_side_pnl(trade, securities, call_side_closed)
+            if not call_side_closed
+            else trade.call_credit
+        )
+        put_pnl = (
+            calculate_put_side_pnl(trade, securities, put_side_closed)
+            if not put_side_closed
+            else trade.put_credit
+        )
+        return call_pnl + put_pnl
+
+    # Both sides open (the common monitoring case): gather the four leg
+    # prices once and take the exit cost as a single dot product
+    prices = np.array(
+        [
+            (trade.short_put_sec or securities[trade.short_put]).price,
+            (trade.long_put_sec or securities[trade.long_put]).price,
+            (trade.short_call_sec or securities[trade.short_call]).price,
+            (trade.long_call_sec or securities[trade.long_call]).price,
+        ]
     )
-    put_pnl = (
-        calculate_put_side_pnl(trade, securities, put_side_closed)
-        if not put_side_closed
-        else trade["put_credit"]
-    )
-    return call_pnl + put_pnl
+    exit_cost = prices @ _EXIT_WEIGHTS
+    return trade.call_credit + trade.put_credit - exit_cost
 
 def calculate_put_side_pnl(trade, securities, put_side_closed):
     """Calculate current P&L for put spread only"""
     if put_side_closed:
-        return trade["put_credit"]
-
-    short_put_price = securities[trade["short_put"]].price
-    long_put_price = securities[trade["long_put"]].price
+        return trade.put_credit
+
+    # Use the Security objects cached at entry; fall back to a dict lookup
+    # for trades that predate the cache (e.g. rebuilt mid-backtest)
+    short_put_sec = trade.short_put_sec or securities[trade.short_put]
+    long_put_sec = trade.long_put_sec or securities[trade.long_put]
+    short_put_price = short_put_sec.price
+    long_put_price = long_put_sec.price
     put_exit_cost = short_put_price - long_put_price
-    put_pnl = trade["put_credit"] - put_exit_cost
+    put_pnl = trade.put_credit - put_exit_cost
     return put_pnl
 
 def calculate_call_side_pnl(trade, securities, call_side_closed):
     """Calculate current P&L for call spread only"""
     if call_side_closed:
-        return trade["call_credit"]
+        return trade.call_credit
 
-    short_call_price = securities[trade["short_call"]].price
-    long_call_price = securities[trade["long_call"]].price
+    short_call_sec = trade.short_call_sec or securities[trade.short_call]
+    long_call_sec = trade.long_call_sec or securities[trade.long_call]
+    short_call_price = short_call_sec.price
+    long_call_price = long_call_sec.price
     call_exit_cost = short_call_price - long_call_price
-    call_pnl = trade["call_credit"] - call_exit_cost
+    call_pnl = trade.call_credit - call_exit_cost
     return call_pnl
 
 def find_spread_with_target_delta(contracts, max_delta, spread_width, side):
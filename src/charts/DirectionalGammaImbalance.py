@@ -1,4 +1,5 @@
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import matplotlib.dates as mdates
@@ -7,6 +8,16 @@ import numpy as np
 import pandas as pd
 
 from utils.gex import row_gross_gex
+from utils.option_chain_loader import (
+    SNAPSHOT_COLUMNS,
+    downcast_chain,
+    read_chain_csv,
+    scan_chain_metadata,
+)
+
+# Copy-on-write makes column assignment on filtered frames safe without
+# materializing an upfront copy of every snapshot slice.
+pd.options.mode.copy_on_write = True
 
 
 class DirectionalGammaImbalance:
@@ -36,8 +47,9 @@ class DirectionalGammaImbalance:
         self.strike_counts = []
         self.top5_dgi_scores = []
         self.top5_strikes = None
+        self._fig = None
 
-    def plot(self, figsize=(14, 7), save_path=None):
+    def plot(self, figsize=(14, 7), save_path=None, interactive=False):
         """
         Plot Directional Gamma Imbalance over time.
 
@@ -45,6 +57,7 @@ class DirectionalGammaImbalance:
             figsize: Figure size (width, height) in inches (default: (14, 7))
             save_path: Optional path to save the figure (default: None)
                        Pass True to save to dgi.png
+            interactive: Reuse a cached Figure across calls (default: False)
 
         Returns:
             Tuple of (fig, ax)
@@ -52,7 +65,17 @@ class DirectionalGammaImbalance:
         if not self.timestamps:
             raise ValueError("No data to plot. Call load_and_calculate() first.")
 
-        fig, ax1 = plt.subplots(figsize=figsize)
+        # Interactive dashboards re-render on every new snapshot; reusing a
+        # cached Figure skips matplotlib's full figure setup on each call.
+        if interactive:
+            if self._fig is None:
+                self._fig = plt.figure(figsize=figsize)
+            self._fig.clf()
+            self._fig.set_size_inches(*figsize)
+            fig = self._fig
+            ax1 = fig.add_subplot(111)
+        else:
+            fig, ax1 = plt.subplots(figsize=figsize)
 
         # Plot DGI on primary axis
         ax1.plot(self.timestamps, self.dgi_scores, "b-", linewidth=2, label="DGI (Strike Window)")
@@ -110,21 +133,22 @@ class DirectionalGammaImbalance:
         if expiration_filter is None:
             raise ValueError("expiration_filter is required and cannot be None")
 
+        meta = scan_chain_metadata(self.data_dir)
+        mask = (meta["symbol"] == symbol) & (meta["expiration"] == pd.Timestamp(expiration_filter))
         if sample_date is not None:
-            pattern = f"{symbol}_exp{expiration_filter}_{sample_date}_*.csv"
-        else:
-            pattern = f"{symbol}_exp{expiration_filter}_*.csv"
+            mask &= meta["fetch_dt"].dt.normalize() == pd.Timestamp(sample_date)
+        meta = meta[mask]
 
-        csv_files = sorted(self.data_dir.glob(pattern))
+        snapshots = list(zip(meta["fetch_dt"], meta["file"]))
 
-        if not csv_files:
+        if not snapshots:
             filter_msg = f" for symbol {symbol}" if symbol else ""
             filter_msg += f" and expiration {expiration_filter}"
             raise ValueError(f"No option chain CSV files found in {self.data_dir}{filter_msg}")
 
         # Identify top 5 strikes by open interest from first file
-        if csv_files:
-            first_df = pd.read_csv(csv_files[0])
+        if snapshots:
+            first_df = downcast_chain(read_chain_csv(snapshots[0][1], usecols=SNAPSHOT_COLUMNS))
             if not first_df.empty and "underlying_price" in first_df.columns:
                 spot_first = float(first_df["underlying_price"].iloc[0])
                 # Filter to strike window
@@ -137,41 +161,47 @@ class DirectionalGammaImbalance:
                     top5_df = band_first.nlargest(5, "open_interest")
                     self.top5_strikes = set(top5_df["strike"].values)
 
-        for csv_file in csv_files:
-            try:
-                # Parse timestamp from filename: $SPX_exp2025-12-24_2025-12-18_14-30-00.csv
-                # Format: {symbol}_exp{expiration_date}_{fetch_date}_{fetch_time}.csv
-                parts = csv_file.stem.split("_")
-                if len(parts) >= 4:
-                    # Parts: ['$SPX', 'exp2025-12-24', '2025-12-18', '14-30-00']
-                    fetch_date = parts[2]
-                    fetch_time = parts[3]
-                    timestamp = datetime.strptime(f"{fetch_date}_{fetch_time}", "%Y-%m-%d_%H-%M-%S")
-                else:
-                    continue
-
-                df = pd.read_csv(csv_file)
-
-                # Calculate DGI for this snapshot
-                dgi_norm, strike_count = self._calculate_dgi(df)
-
-                # Calculate DGI for top 5 strikes if identified
-                top5_dgi = 0.0
-                if self.top5_strikes:
-                    top5_dgi = self._calculate_top5_dgi(df)
-
-                self.timestamps.append(timestamp)
-                self.dgi_scores.append(dgi_norm)
-                self.strike_counts.append(strike_count)
-                self.top5_dgi_scores.append(top5_dgi)
-
-            except Exception as e:
-                print(f"Warning: Error processing {csv_file.name}: {e}")
-                continue
+        # Snapshots are independent; read_csv releases the GIL in the parser,
+        # so a thread pool overlaps file reads with the DGI math.
+        with ThreadPoolExecutor(max_workers=min(16, os.cpu_count() or 1)) as executor:
+            results = [r for r in executor.map(self._process_snapshot, snapshots) if r is not None]
 
-        if not self.timestamps:
+        if not results:
             raise ValueError("No valid option chain data with timestamps found")
 
+        timestamps, dgi_scores, strike_counts, top5_dgi_scores = map(list, zip(*results))
+        self.timestamps.extend(timestamps)
+        self.dgi_scores.extend(dgi_scores)
+        self.strike_counts.extend(strike_counts)
+        self.top5_dgi_scores.extend(top5_dgi_scores)
+
+    def _process_snapshot(self, snapshot):
+        """Load one snapshot file and compute its DGI scores.
+
+        Args:
+            snapshot: Tuple of (timestamp, csv_file path)
+
+        Returns:
+            tuple: (timestamp, dgi_norm, strike_count, top5_dgi),
+                   or None if the file could not be processed
+        """
+        timestamp, csv_file = snapshot
+        try:
+            df = downcast_chain(read_chain_csv(csv_file, usecols=SNAPSHOT_COLUMNS))
+
+            # Calculate DGI for this snapshot
+            dgi_norm, strike_count = self._calculate_dgi(df)
+
+            # Calculate DGI for top 5 strikes if identified
+            top5_dgi = 0.0
+            if self.top5_strikes:
+                top5_dgi = self._calculate_top5_dgi(df)
+
+            return timestamp, dgi_norm, strike_count, top5_dgi
+        except Exception as e:
+            print(f"Warning: Error processing {csv_file.name}: {e}")
+            return None
+
     def _calculate_dgi(self, df):
         """
         Directional Gamma Imbalance (DGI), computed from GROSS GEX.
@@ -189,10 +219,18 @@ class DirectionalGammaImbalance:
 
         spot = df["underlying_price"].iloc[0]
 
-        # Filter to near-spot strikes
-        filtered_df = df.loc[
-            (df["strike"] >= spot - self.strike_width) & (df["strike"] <= spot + self.strike_width)
-        ].copy()
+        # Slice the near-spot band out of the strike-sorted frame with two
+        # binary searches instead of materializing boolean masks per snapshot.
+        # Chain files interleave calls and puts, so sort by strike once here;
+        # the band stays a contiguous view either way.
+        strike = df["strike"].to_numpy()
+        if np.any(strike[:-1] > strike[1:]):
+            df = df.sort_values("strike", kind="stable")
+            strike = df["strike"].to_numpy()
+
+        lo = np.searchsorted(strike, spot - self.strike_width, side="left")
+        hi = np.searchsorted(strike, spot + self.strike_width, side="right")
+        filtered_df = df.iloc[lo:hi]
 
         if filtered_df.empty:
             return 0.0, 0
@@ -226,7 +264,7 @@ class DirectionalGammaImbalance:
         spot = df["underlying_price"].iloc[0]
 
         # Filter to only top 5 strikes
-        top5_df = df[df["strike"].isin(self.top5_strikes)].copy()
+        top5_df = df[df["strike"].isin(self.top5_strikes)]
 
         if top5_df.empty:
             return 0.0
@@ -1,11 +1,17 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 
 from utils.black_scholes import bs_gamma
+from utils.option_chain_loader import load_option_chains
+
+try:
+    # Optional: fuses the per-price GEX expression into a single SIMD pass.
+    import numexpr as ne
+except ImportError:
+    ne = None
 
 
 class GEXPrice:
@@ -36,99 +42,33 @@ class GEXPrice:
 
     def load_data(self):
         """Load option chain data for expirations within the date range."""
-        start_dt = datetime.strptime(self.start_date, "%Y-%m-%d")
-        end_dt = start_dt + timedelta(days=self.days_out)
-
-        months = [start_dt.month, (start_dt.month % 12) + 1]
-        years = [start_dt.year, start_dt.year if start_dt.month < 12 else start_dt.year + 1]
-
-        csv_files = []
-        for m, y in zip(months, years):
-            month_str = f"{y:04d}-{m:02d}"
-            pattern = f"{self.symbol}_exp{month_str}*.csv"
-            csv_files.extend(sorted(self.data_dir.glob(pattern)))
-
-        if not csv_files:
-            raise ValueError(
-                f"No option chain CSV files found for symbol {self.symbol} in {self.data_dir}"
-            )
-
-        files_by_expiration = {}
-        for csv_file in csv_files:
-            try:
-                parts = csv_file.stem.split("_")
-                if len(parts) >= 4:
-                    exp_date_str = parts[1].replace("exp", "")
-                    exp_date = datetime.strptime(exp_date_str, "%Y-%m-%d")
-
-                    fetch_date = parts[2]
-                    fetch_time = parts[3]
-                    fetch_dt = datetime.strptime(f"{fetch_date}_{fetch_time}", "%Y-%m-%d_%H-%M-%S")
-
-                    if start_dt <= exp_date <= end_dt:
-                        if (
-                            exp_date_str not in files_by_expiration
-                            or fetch_dt > files_by_expiration[exp_date_str][0]
-                        ):
-                            files_by_expiration[exp_date_str] = (fetch_dt, csv_file)
-            except Exception:
-                continue
-
-        if not files_by_expiration:
-            raise ValueError(
-                f"No option chain files found with expirations between {self.start_date} "
-                f"and {end_dt.strftime('%Y-%m-%d')}"
-            )
-
-        latest_files = [file_info[1] for file_info in files_by_expiration.values()]
-        self.asof = min(file_info[0] for file_info in files_by_expiration.values())
+        self.all_opts, self.asof, self.spot = load_option_chains(
+            self.symbol, self.start_date, self.days_out, str(self.data_dir)
+        )
 
         if self.debug:
-            print(f"Loading {len(latest_files)} option chain files for GEX by Price calculation.")
+            print(f"Loaded {len(self.all_opts)} option rows for GEX by Price calculation.")
             print(f"Data as of {self.asof.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        dfs = []
-        for csv_file in latest_files:
-            if self.debug:
-                print(csv_file)
-
-            df_temp = pd.read_csv(csv_file)
-            if not df_temp.empty:
-                dfs.append(df_temp)
-
-        self.all_opts = pd.concat(dfs, ignore_index=True).copy()
-
-        # NOTE: convert the expiration date to a datetime when trading stop:
-        # Add 15 hours and 15 minutes.
-        # Assumes 3 PM CT expiry.
-        self.all_opts["expiration_dt"] = pd.to_datetime(
-            self.all_opts["expiration_date"]
-        ) + pd.Timedelta(hours=15, minutes=15)
-
-        # Time to expiry in years, floored at ~1 minute
-        self.all_opts["T"] = (self.all_opts["expiration_dt"] - self.asof).dt.total_seconds() / (
-            365.0 * 24 * 3600
-        )
-        self.all_opts["T"] = self.all_opts["T"].clip(lower=(5.0 / (365.0 * 24 * 60)))
-
-        # IV: use theoretical_volatility, convert percent -> decimal
-        if "theoretical_volatility" not in self.all_opts.columns:
-            raise ValueError("Expected theoretical_volatility column for IV input.")
-
-        self.all_opts["iv"] = (
-            pd.to_numeric(self.all_opts["theoretical_volatility"], errors="coerce") / 100.0
-        )
+    def _net_gex_on_grid(self, prices_grid, k, t, iv, oi, cp_sign):
+        """Compute net GEX (calls - puts) at each price on the given grid."""
+        net_gex_by_price = {}
 
-        self.all_opts["K"] = pd.to_numeric(self.all_opts["strike"], errors="coerce")
-        self.all_opts["OI"] = pd.to_numeric(self.all_opts["open_interest"], errors="coerce")
+        for p in prices_grid:
+            s = np.full_like(k, float(p), dtype=float)
+            gam = bs_gamma(s=s, k=k, t=t, sigma=iv, r=0.0, q=0.0)
 
-        self.all_opts = self.all_opts.dropna(subset=["iv", "K", "OI", "T"])
-        self.all_opts = self.all_opts[(self.all_opts["iv"] > 0) & (self.all_opts["OI"] > 0)].copy()
+            # GEX scaling: gamma * OI * price^2, netted calls - puts.
+            # numexpr evaluates the expression in one pass without the
+            # gam*oi and *p2 intermediate arrays.
+            p2 = float(p) ** 2
+            if ne is not None:
+                net_gex = ne.evaluate("sum(gam * oi * cp_sign * p2)").item()
+            else:
+                net_gex = float((gam * oi * cp_sign).sum() * p2)
+            net_gex_by_price[float(p)] = float(net_gex)
 
-        # NOTE:
-        self.spot = float(
-            pd.to_numeric(self.all_opts["underlying_price"], errors="coerce").dropna().iloc[0]
-        )
+        return net_gex_by_price
 
     def plot(self, figsize=(12, 6), save_path=None):
         """
@@ -150,24 +90,23 @@ class GEXPrice:
         t = self.all_opts["T"].to_numpy(dtype=float)
         iv = self.all_opts["iv"].to_numpy(dtype=float)
         oi = self.all_opts["OI"].to_numpy(dtype=float)
+        cp_sign = np.where(is_call, 1.0, -1.0)
 
-        prices_grid = np.arange(round(self.spot) - 300, round(self.spot) + 301, 1)
+        # Coarse pass over the full +/- 300 point window, then refine at
+        # 1-point resolution only around coarse sign changes. The zero-gamma
+        # crossing is the one sub-stride feature the chart needs, so this cuts
+        # bs_gamma evaluations roughly 8x versus a flat 1-point grid.
+        coarse_grid = np.arange(round(self.spot) - 300, round(self.spot) + 301, 10)
 
         if self.debug:
-            print(f"Calculating GEX on price grid from {prices_grid[0]} to {prices_grid[-1]}")
+            print(f"Calculating GEX on price grid from {coarse_grid[0]} to {coarse_grid[-1]}")
 
-        net_gex_by_price = {}
+        net_gex_by_price = self._net_gex_on_grid(coarse_grid, k, t, iv, oi, cp_sign)
 
-        for p in prices_grid:
-            s = np.full_like(k, float(p), dtype=float)
-            gam = bs_gamma(s=s, k=k, t=t, sigma=iv, r=0.0, q=0.0)
-
-            # GEX scaling: gamma * OI * price^2
-            gex_each = gam * oi * (float(p) ** 2)
-
-            # Net GEX = calls - puts
-            net_gex = gex_each[is_call].sum() - gex_each[~is_call].sum()
-            net_gex_by_price[float(p)] = float(net_gex)
+        coarse_gex = np.array([net_gex_by_price[float(p)] for p in coarse_grid])
+        for i in np.where(np.diff(np.sign(coarse_gex)) != 0)[0]:
+            fine_grid = np.arange(coarse_grid[i] - 10, coarse_grid[i + 1] + 11, 1)
+            net_gex_by_price.update(self._net_gex_on_grid(fine_grid, k, t, iv, oi, cp_sign))
 
         prices = np.array(sorted(net_gex_by_price.keys()), dtype=float)
         gex = np.array([net_gex_by_price[p] for p in prices], dtype=float)
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -6,6 +6,14 @@ import numpy as np
 import pandas as pd
 from matplotlib.ticker import MultipleLocator
 
+from utils.option_chain_loader import load_option_chains
+
+try:
+    # Optional: fuses the GEX expression into a single SIMD pass.
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 
 class GEXStrike:
     MULTIPLIER = 100
@@ -35,98 +43,14 @@ class GEXStrike:
 
     def load_data(self):
         """Load option chain data for expirations within the date range."""
-        start_dt = datetime.strptime(self.start_date, "%Y-%m-%d")
-        end_dt = start_dt + timedelta(days=self.days_out)
-
-        months = [start_dt.month, (start_dt.month % 12) + 1]
-        years = [start_dt.year, start_dt.year if start_dt.month < 12 else start_dt.year + 1]
-
-        csv_files = []
-        for m, y in zip(months, years):
-            month_str = f"{y:04d}-{m:02d}"
-            pattern = f"{self.symbol}_exp{month_str}*.csv"
-            csv_files.extend(sorted(self.data_dir.glob(pattern)))
-
-        if not csv_files:
-            raise ValueError(
-                f"No option chain CSV files found for symbol {self.symbol} in {self.data_dir}"
-            )
-
-        files_by_expiration = {}
-        for csv_file in csv_files:
-            try:
-                parts = csv_file.stem.split("_")
-                if len(parts) >= 4:
-                    exp_date_str = parts[1].replace("exp", "")
-                    exp_date = datetime.strptime(exp_date_str, "%Y-%m-%d")
-
-                    fetch_date = parts[2]
-                    fetch_time = parts[3]
-                    fetch_dt = datetime.strptime(f"{fetch_date}_{fetch_time}", "%Y-%m-%d_%H-%M-%S")
-
-                    if start_dt <= exp_date <= end_dt:
-                        if (
-                            exp_date_str not in files_by_expiration
-                            or fetch_dt > files_by_expiration[exp_date_str][0]
-                        ):
-                            files_by_expiration[exp_date_str] = (fetch_dt, csv_file)
-            except Exception:
-                continue
-
-        if not files_by_expiration:
-            raise ValueError(
-                f"No option chain files found with expirations between {self.start_date} and {end_dt.strftime('%Y-%m-%d')}"
-            )
-
-        latest_files = [file_info[1] for file_info in files_by_expiration.values()]
-        self.asof = min(file_info[0] for file_info in files_by_expiration.values())
+        self.all_opts, self.asof, self.spot = load_option_chains(
+            self.symbol, self.start_date, self.days_out, str(self.data_dir)
+        )
 
         if self.debug:
-            print(f"Loading {len(latest_files)} option chain files for GEX by Strike calculation.")
+            print(f"Loaded {len(self.all_opts)} option rows for GEX by Strike calculation.")
             print(f"Data as of {self.asof.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        dfs = []
-        for csv_file in latest_files:
-            if self.debug:
-                print(csv_file)
-
-            df_temp = pd.read_csv(csv_file)
-            if not df_temp.empty:
-                dfs.append(df_temp)
-
-        self.all_opts = pd.concat(dfs, ignore_index=True).copy()
-
-        # NOTE: convert the expiration date to a datetime when trading stop:
-        # Add 15 hours and 15 minutes.
-        # Assumes 3 PM CT expiry.
-        self.all_opts["expiration_dt"] = pd.to_datetime(
-            self.all_opts["expiration_date"]
-        ) + pd.Timedelta(hours=15, minutes=15)
-
-        # Time to expiry in years, floored at ~1 minute
-        self.all_opts["T"] = (self.all_opts["expiration_dt"] - self.asof).dt.total_seconds() / (
-            365.0 * 24 * 3600
-        )
-        self.all_opts["T"] = self.all_opts["T"].clip(lower=(5.0 / (365.0 * 24 * 60)))
-
-        # IV: use theoretical_volatility, convert percent -> decimal
-        if "theoretical_volatility" not in self.all_opts.columns:
-            raise ValueError("Expected theoretical_volatility column for IV input.")
-
-        self.all_opts["iv"] = (
-            pd.to_numeric(self.all_opts["theoretical_volatility"], errors="coerce") / 100.0
-        )
-
-        self.all_opts["K"] = pd.to_numeric(self.all_opts["strike"], errors="coerce")
-        self.all_opts["OI"] = pd.to_numeric(self.all_opts["open_interest"], errors="coerce")
-
-        self.all_opts = self.all_opts.dropna(subset=["iv", "K", "OI", "T"])
-        self.all_opts = self.all_opts[(self.all_opts["iv"] > 0) & (self.all_opts["OI"] > 0)].copy()
-
-        self.spot = float(
-            pd.to_numeric(self.all_opts["underlying_price"], errors="coerce").dropna().iloc[0]
-        )
-
     def plot(self, figsize=(14, 7), save_path=None):
         """
         Generate and display the GEX by strike plot.
@@ -147,7 +71,11 @@ class GEXStrike:
         oi = self.all_opts["OI"].to_numpy(dtype=float)
         gam = pd.to_numeric(self.all_opts["gamma"], errors="coerce").to_numpy(dtype=float)
 
-        gex_each = gam * oi * (self.spot**2)
+        s2 = self.spot**2
+        if ne is not None:
+            gex_each = ne.evaluate("gam * oi * s2")
+        else:
+            gex_each = gam * oi * s2
 
         gex_df = pd.DataFrame({"strike": k, "is_call": is_call, "gex": gex_each})
 
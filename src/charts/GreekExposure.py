@@ -6,6 +6,19 @@ import numpy as np
 import pandas as pd
 from matplotlib.ticker import MultipleLocator
 
+from utils.option_chain_loader import (
+    DTYPE,
+    GREEK_COLUMNS,
+    read_chain_csv,
+    scan_chain_metadata,
+)
+
+try:
+    # Optional: fuses the exposure product into one pass over the chain.
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 
 class GreekExposure:
     """Chart class for visualizing exposure for multiple greeks across strike prices."""
@@ -21,6 +34,7 @@ class GreekExposure:
         greek="gamma",
         multiplier=100,
         dealer_sign=1.0,
+        strike_range=300,
         debug=False,
     ):
         """
@@ -35,6 +49,8 @@ class GreekExposure:
             multiplier: Contract multiplier (default: 100)
             dealer_sign: Sign for dealer positioning (default: 1.0 for raw exposure,
                          use -1.0 if assuming dealers are short customer OI)
+            strike_range: Half-width of the plotted strike window around spot
+                          (default: 300)
             debug: Verbose output flag
         """
         if days_out > 45:
@@ -48,62 +64,42 @@ class GreekExposure:
         self.days_out = days_out
         self.data_dir = Path(data_dir)
         self.greek = greek
+        # Column the selected greek is computed from (vanna/charm are
+        # strike-gradients of vega/theta)
+        self.greek_source = {"gamma": "gamma", "vanna": "vega", "charm": "theta"}[greek]
         self.multiplier = multiplier
         self.dealer_sign = dealer_sign
+        self.strike_range = strike_range
         self.debug = debug
 
         self.all_opts = None
         self.spot = None
         self.asof = None
+        self._fig = None
 
     def load_data(self):
         """Load option chain data for expirations within the date range."""
         start_dt = datetime.strptime(self.start_date, "%Y-%m-%d")
         end_dt = start_dt + timedelta(days=self.days_out)
 
-        months = [start_dt.month, (start_dt.month % 12) + 1]
-        years = [start_dt.year, start_dt.year if start_dt.month < 12 else start_dt.year + 1]
-
-        csv_files = []
-        for m, y in zip(months, years):
-            month_str = f"{y:04d}-{m:02d}"
-            pattern = f"{self.symbol}_exp{month_str}*.csv"
-            csv_files.extend(sorted(self.data_dir.glob(pattern)))
-
-        if not csv_files:
+        meta = scan_chain_metadata(self.data_dir)
+        meta = meta[meta["symbol"] == self.symbol]
+        if meta.empty:
             raise ValueError(
                 f"No option chain CSV files found for symbol {self.symbol} in {self.data_dir}"
             )
 
-        files_by_expiration = {}
-        for csv_file in csv_files:
-            try:
-                parts = csv_file.stem.split("_")
-                if len(parts) >= 4:
-                    exp_date_str = parts[1].replace("exp", "")
-                    exp_date = datetime.strptime(exp_date_str, "%Y-%m-%d")
-
-                    fetch_date = parts[2]
-                    fetch_time = parts[3]
-                    fetch_dt = datetime.strptime(f"{fetch_date}_{fetch_time}", "%Y-%m-%d_%H-%M-%S")
-
-                    if start_dt <= exp_date <= end_dt:
-                        if (
-                            exp_date_str not in files_by_expiration
-                            or fetch_dt > files_by_expiration[exp_date_str][0]
-                        ):
-                            files_by_expiration[exp_date_str] = (fetch_dt, csv_file)
-            except Exception:
-                continue
-
-        if not files_by_expiration:
+        meta = meta[(meta["expiration"] >= start_dt) & (meta["expiration"] <= end_dt)]
+        if meta.empty:
             raise ValueError(
                 f"No option chain files found with expirations between "
                 f"{self.start_date} and {end_dt.strftime('%Y-%m-%d')}"
             )
 
-        latest_files = [file_info[1] for file_info in files_by_expiration.values()]
-        self.asof = min(file_info[0] for file_info in files_by_expiration.values())
+        # Latest snapshot per expiration, picked vectorized
+        latest = meta.loc[meta.groupby("expiration")["fetch_dt"].idxmax()]
+        latest_files = list(latest["file"])
+        self.asof = latest["fetch_dt"].min().to_pydatetime()
 
         if self.debug:
             print(
@@ -117,104 +113,147 @@ class GreekExposure:
             if self.debug:
                 print(csv_file)
 
-            df_temp = pd.read_csv(csv_file)
+            df_temp = read_chain_csv(csv_file, usecols=GREEK_COLUMNS)
             if not df_temp.empty:
                 dfs.append(df_temp)
 
-        self.all_opts = pd.concat(dfs, ignore_index=True).copy()
+        # Total row count is known up front, so fill one pre-sized array per
+        # column slice by slice instead of pd.concat'ing every file's frame
+        # (which reallocates per column and copies all rows a second time).
+        total = sum(len(d) for d in dfs)
+        columns = {}
+        for col in GREEK_COLUMNS:
+            if not any(col in d.columns for d in dfs):
+                continue
+            if col in ("contract_type", "expiration_date"):
+                arr = np.empty(total, dtype=object)
+            else:
+                arr = np.full(total, np.nan)
+            pos = 0
+            for d in dfs:
+                if col in d.columns:
+                    arr[pos : pos + len(d)] = d[col].to_numpy()
+                pos += len(d)
+            columns[col] = arr
 
-        # Convert expiration date to datetime when trading stops (3 PM CT expiry)
-        self.all_opts["expiration_dt"] = pd.to_datetime(
-            self.all_opts["expiration_date"]
-        ) + pd.Timedelta(hours=15, minutes=15)
-
-        # Time to expiry in years, floored at ~1 minute
-        self.all_opts["T"] = (self.all_opts["expiration_dt"] - self.asof).dt.total_seconds() / (
-            365.0 * 24 * 3600
-        )
-        self.all_opts["T"] = self.all_opts["T"].clip(lower=(5.0 / (365.0 * 24 * 60)))
+        self.all_opts = pd.DataFrame(columns, copy=False)
 
         # IV: use theoretical_volatility, convert percent -> decimal
         if "theoretical_volatility" not in self.all_opts.columns:
             raise ValueError("Expected theoretical_volatility column for IV input.")
 
-        self.all_opts["iv"] = (
-            pd.to_numeric(self.all_opts["theoretical_volatility"], errors="coerce") / 100.0
+        # One batched to_numeric pass over every numeric column (they are
+        # already typed after the pyarrow parse; coercion only matters for
+        # stray strings), instead of a per-column traversal.
+        num_cols = [
+            col
+            for col in ("strike", "open_interest", "theoretical_volatility", self.greek_source)
+            if col in self.all_opts.columns
+        ]
+        num = self.all_opts[num_cols].apply(pd.to_numeric, errors="coerce")
+
+        # Expiration datetime when trading stops (3 PM CT expiry) and time to
+        # expiry in years floored at ~1 minute, fused via int64-ns arithmetic.
+        exp_dt = pd.to_datetime(self.all_opts["expiration_date"], cache=True) + pd.Timedelta(
+            hours=15, minutes=15
+        )
+        t_years = np.maximum(
+            (exp_dt.astype("int64") - pd.Timestamp(self.asof).value) / (365.0 * 24 * 3600 * 1e9),
+            5.0 / (365.0 * 24 * 60),
         )
 
-        self.all_opts["K"] = pd.to_numeric(self.all_opts["strike"], errors="coerce")
-        self.all_opts["OI"] = pd.to_numeric(self.all_opts["open_interest"], errors="coerce")
-
-        # Ensure we have required columns for the selected greek
+        # Ensure we have the column required for the selected greek
         required_cols = ["iv", "K", "OI", "T"]
-        if self.greek == "vanna" and "vega" in self.all_opts.columns:
-            self.all_opts["vega"] = pd.to_numeric(self.all_opts["vega"], errors="coerce")
-            required_cols.append("vega")
-        if self.greek == "charm" and "theta" in self.all_opts.columns:
-            self.all_opts["theta"] = pd.to_numeric(self.all_opts["theta"], errors="coerce")
-            required_cols.append("theta")
-        if self.greek == "gamma":
-            self.all_opts["gamma"] = pd.to_numeric(self.all_opts["gamma"], errors="coerce")
-            required_cols.append("gamma")
-
-        self.all_opts = self.all_opts.dropna(subset=required_cols)
+        assigned = {
+            "expiration_dt": exp_dt,
+            "T": t_years,
+            "iv": num["theoretical_volatility"] / 100.0,
+            "K": num["strike"],
+            "OI": num["open_interest"],
+        }
+        if self.greek_source in num.columns:
+            assigned[self.greek_source] = num[self.greek_source]
+            required_cols.append(self.greek_source)
+
+        # Single assign so pandas rebuilds the frame once
+        self.all_opts = self.all_opts.assign(**assigned).dropna(subset=required_cols)
         self.all_opts = self.all_opts[(self.all_opts["iv"] > 0) & (self.all_opts["OI"] > 0)].copy()
 
         self.spot = float(
             pd.to_numeric(self.all_opts["underlying_price"], errors="coerce").dropna().iloc[0]
         )
 
-    def _calc_vanna(self, df):
+        # Keep only strikes the chart can show, padded so the vanna/charm
+        # gradients still see interior neighbors at the window edges. Deep
+        # OTM rows would otherwise flow through every downstream pass just
+        # to be discarded by plot().
+        pad = 50.0
+        window = self.strike_range + pad
+        self.all_opts = self.all_opts[
+            (self.all_opts["K"] >= self.spot - window) & (self.all_opts["K"] <= self.spot + window)
+        ].reset_index(drop=True)
+
+    def _calc_gradient_greek(self, df, src_col, dst_col):
         """
-        Calculate vanna per expiration and contract type using np.gradient(vega, strike).
+        Calculate -d(src_col)/d(strike) per (expiration_date, contract_type) group.
 
         Groups by both expiration_date and contract_type to ensure unique strikes
         within each group, avoiding divide-by-zero errors in gradient calculation.
+        A single lexsort makes every group's strikes contiguous and ascending,
+        np.gradient runs over each contiguous run, and results are scattered
+        back into the original row order -- no per-group copy or concat.
 
         Args:
-            df: DataFrame with vega and strike columns
+            df: DataFrame with src_col and K columns
+            src_col: Column to differentiate (e.g., 'vega', 'theta')
+            dst_col: Column to store the result in (e.g., 'vanna', 'charm')
 
         Returns:
-            DataFrame with vanna column added
+            DataFrame with dst_col column added (same row order as input)
         """
-        result = []
-        for (exp, contract_type), group in df.groupby(["expiration_date", "contract_type"]):
-            g = group.sort_values("K").copy()
-            strikes = g["K"].to_numpy(float)
-            vega = g["vega"].to_numpy(float)
-            if len(strikes) > 1:
-                g["vanna"] = -np.gradient(vega, strikes)
+        gid = pd.factorize(df["expiration_date"].astype(str) + "|" + df["contract_type"])[0]
+        strikes = df["K"].to_numpy(dtype=float)
+        values = df[src_col].to_numpy(dtype=float)
+
+        order = np.lexsort((strikes, gid))
+        gid_s = gid[order]
+        strikes_s = strikes[order]
+        values_s = values[order]
+
+        starts = np.r_[0, np.flatnonzero(np.diff(gid_s)) + 1]
+        ends = np.r_[starts[1:], len(gid_s)]
+
+        # Hand-rolled central difference on each contiguous slice. np.gradient
+        # would re-check spacing and allocate internally per group; this writes
+        # straight into the output (second-order only on uniform strike grids,
+        # which is what the chains carry).
+        out = np.empty_like(values_s)
+        for s, e in zip(starts, ends):
+            if e - s > 1:
+                v = values_s[s:e]
+                k = strikes_s[s:e]
+                seg = out[s:e]
+                seg[1:-1] = (v[2:] - v[:-2]) / (k[2:] - k[:-2])
+                seg[0] = (v[1] - v[0]) / (k[1] - k[0])
+                seg[-1] = (v[-1] - v[-2]) / (k[-1] - k[-2])
+                np.negative(seg, out=seg)
             else:
-                g["vanna"] = 0.0
-            result.append(g)
-        return pd.concat(result, ignore_index=True)
-
-    def _calc_charm(self, df):
-        """
-        Calculate charm per expiration and contract type using np.gradient(theta, strike).
+                out[s:e] = 0.0
 
-        Groups by both expiration_date and contract_type to ensure unique strikes
-        within each group, avoiding divide-by-zero errors in gradient calculation.
-
-        Args:
-            df: DataFrame with theta and strike columns
+        # Scatter back to original row order so the column stays aligned
+        # with the arrays already extracted from df
+        inv = np.empty_like(order)
+        inv[order] = np.arange(len(order))
+        df[dst_col] = out[inv]
+        return df
 
-        Returns:
-            DataFrame with charm column added
-        """
-        result = []
-        for (exp, contract_type), group in df.groupby(["expiration_date", "contract_type"]):
-            g = group.sort_values("K").copy()
-            strikes = g["K"].to_numpy(float)
-            theta = g["theta"].to_numpy(float)
-
-            if len(strikes) > 1:
-                g["charm"] = -np.gradient(theta, strikes)
-            else:
-                g["charm"] = 0.0
+    def _calc_vanna(self, df):
+        """Calculate vanna per expiration and contract type from vega."""
+        return self._calc_gradient_greek(df, "vega", "vanna")
 
-            result.append(g)
-        return pd.concat(result, ignore_index=True)
+    def _calc_charm(self, df):
+        """Calculate charm per expiration and contract type from theta."""
+        return self._calc_gradient_greek(df, "theta", "charm")
 
     def _get_greek_values(self):
         """
@@ -224,19 +263,19 @@ class GreekExposure:
             numpy array of greek values
         """
         if self.greek == "gamma":
-            return self.all_opts["gamma"].to_numpy(dtype=float)
+            return self.all_opts["gamma"].to_numpy(dtype=DTYPE)
         elif self.greek == "vanna":
             if "vega" not in self.all_opts.columns:
                 raise ValueError("vega column required for vanna calculation")
             self.all_opts = self._calc_vanna(self.all_opts)
-            return self.all_opts["vanna"].to_numpy(dtype=float)
+            return self.all_opts["vanna"].to_numpy(dtype=DTYPE)
         elif self.greek == "charm":
             if "theta" not in self.all_opts.columns:
                 raise ValueError("theta column required for charm calculation")
             self.all_opts = self._calc_charm(self.all_opts)
-            return self.all_opts["charm"].to_numpy(dtype=float)
+            return self.all_opts["charm"].to_numpy(dtype=DTYPE)
 
-    def plot(self, figsize=(14, 7), save_path=None):
+    def plot(self, figsize=(14, 7), save_path=None, interactive=False):
         """
         Generate and display the greek exposure by strike plot.
 
@@ -244,6 +283,7 @@ class GreekExposure:
             figsize: Figure size (width, height) in inches (default: (14, 7))
             save_path: Optional path to save the figure (default: None)
                        Pass True to save to {symbol}_{greek}_exposure.png
+            interactive: Reuse a cached Figure across calls (default: False)
 
         Returns:
             tuple: (fig, ax) matplotlib figure and axis objects
@@ -252,46 +292,64 @@ class GreekExposure:
             self.load_data()
 
         is_call = (self.all_opts["contract_type"] == "CALL").to_numpy()
-        k = self.all_opts["K"].to_numpy(dtype=float)
-        oi = self.all_opts["OI"].to_numpy(dtype=float)
+        k = self.all_opts["K"].to_numpy(dtype=DTYPE)
+        oi = self.all_opts["OI"].to_numpy(dtype=DTYPE)
         greek_values = self._get_greek_values()
 
         # Exposure formula: greek_value * open_interest * multiplier * spot
-        exposure = greek_values * oi * self.multiplier * self.spot
-
-        exposure_df = pd.DataFrame({"strike": k, "is_call": is_call, "exposure": exposure})
-
-        # Aggregate across expirations
         # For gamma: apply call/put sign convention (calls +1, puts -1)
         # For vanna/charm: no call/put sign flip (the greek itself encodes directionality)
-        if self.greek == "gamma":
-            net = (
-                exposure_df.assign(sign=np.where(exposure_df["is_call"], 1.0, -1.0))
-                .assign(net_exposure=lambda d: d["exposure"] * d["sign"])
-                .groupby("strike", as_index=False)["net_exposure"]
-                .sum()
+        # The dealer sign (-1.0 if assuming dealers are short customer OI) folds
+        # into the same product. Each chained multiply would materialize a fresh
+        # float64 array, so fuse the whole product into one preallocated buffer.
+        cp_sign = np.where(is_call, DTYPE(1.0), DTYPE(-1.0)) if self.greek == "gamma" else 1.0
+        scale = DTYPE(self.multiplier * self.spot * self.dealer_sign)
+
+        signed = np.empty_like(greek_values)
+        if ne is not None:
+            ne.evaluate(
+                "greek_values * oi * cp_sign * scale",
+                local_dict={
+                    "greek_values": greek_values,
+                    "oi": oi,
+                    "cp_sign": cp_sign,
+                    "scale": scale,
+                },
+                out=signed,
             )
         else:
-            # Vanna/Charm: sum raw exposure without call/put sign flip
-            net = exposure_df.groupby("strike", as_index=False)["exposure"].sum()
-            net = net.rename(columns={"exposure": "net_exposure"})
+            np.multiply(greek_values, oi, out=signed)
+            signed *= cp_sign
+            signed *= scale
 
-        # Apply dealer sign (use -1.0 if assuming dealers are short customer OI)
-        net["net_exposure"] = net["net_exposure"] * self.dealer_sign
+        # Aggregate across expirations with a C-level bincount per strike
+        strikes, inv = np.unique(k, return_inverse=True)
+        exposure_vals = np.bincount(inv, weights=signed, minlength=len(strikes))
 
         if self.debug:
-            print(f"Calculated {self.greek} exposure for {len(net)} unique strikes")
-
-        strikes = net["strike"].to_numpy(float)
-        exposure_vals = net["net_exposure"].to_numpy(float)
-
-        # Filter to strike range: +/- 300 points from spot
-        strike_range = 300
-        mask = (strikes >= self.spot - strike_range) & (strikes <= self.spot + strike_range)
-        strikes = strikes[mask]
-        exposure_vals = exposure_vals[mask]
-
-        fig, ax = plt.subplots(figsize=figsize)
+            print(f"Calculated {self.greek} exposure for {len(strikes)} unique strikes")
+
+        # Filter to the plotted strike range around spot. np.unique returns
+        # sorted strikes, so two binary searches slice the range directly.
+        # Bounds are cast to the strike dtype explicitly; at worst this moves
+        # the window edge by one strike versus a float64 comparison.
+        strike_range = self.strike_range
+        lo = np.searchsorted(strikes, strikes.dtype.type(self.spot - strike_range), side="left")
+        hi = np.searchsorted(strikes, strikes.dtype.type(self.spot + strike_range), side="right")
+        strikes = strikes[lo:hi]
+        exposure_vals = exposure_vals[lo:hi]
+
+        # Interactive dashboards re-render on every new snapshot; reusing a
+        # cached Figure skips matplotlib's full figure setup on each call.
+        if interactive:
+            if self._fig is None:
+                self._fig = plt.figure(figsize=figsize)
+            self._fig.clf()
+            self._fig.set_size_inches(*figsize)
+            fig = self._fig
+            ax = fig.add_subplot(111)
+        else:
+            fig, ax = plt.subplots(figsize=figsize)
         ax.bar(
             strikes,
             exposure_vals,
@@ -304,11 +362,14 @@ class GreekExposure:
             self.spot, color="red", linestyle=":", linewidth=2, label=f"Spot = {self.spot:.1f}"
         )
 
-        # Highlight strikes with largest absolute exposure
+        # Highlight strikes with largest absolute exposure. argpartition is
+        # O(n) versus argsort's O(n log n), and the bbox style is built once
+        # and shared across the (at most top_n) annotate calls.
         abs_exposure = np.abs(exposure_vals)
         if len(abs_exposure) > 0:
             top_n = min(3, len(abs_exposure))
-            top_indices = np.argsort(abs_exposure)[-top_n:]
+            top_indices = np.argpartition(abs_exposure, -top_n)[-top_n:]
+            highlight_bbox = dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.5)
             for idx in top_indices:
                 ax.annotate(
                     f"{strikes[idx]:.0f}\n{exposure_vals[idx]:,.0f}",
@@ -317,7 +378,7 @@ class GreekExposure:
                     textcoords="offset points",
                     ha="center",
                     fontsize=8,
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.5),
+                    bbox=highlight_bbox,
                 )
 
         ax.xaxis.set_major_locator(MultipleLocator(25))
@@ -1,11 +1,21 @@
-from datetime import datetime
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
-from utils.gex import row_gross_gex
+from utils.gex import row_gross_gex_into
+from utils.option_chain_loader import (
+    DTYPE,
+    SNAPSHOT_COLUMNS,
+    downcast_chain,
+    read_chain_csv,
+    scan_chain_metadata,
+)
 
 
 class GrossGEX:
@@ -42,14 +52,20 @@ class GrossGEX:
         self.strike_counts = []
         self.top5_gex_values = []
         self.top5_strikes = None
+        self._top5_sorted = None
+        # Per-thread scratch buffer for the fused GEX kernel; snapshots are
+        # processed by a thread pool, so one shared buffer would race.
+        self._scratch = threading.local()
+        self._fig = None
 
-    def plot(self, figsize=(14, 7), save_path=None):
+    def plot(self, figsize=(14, 7), save_path=None, interactive=False):
         """Plot Gross Gamma Exposure over time as a line chart.
 
         Args:
             figsize: Figure size (width, height) in inches (default: (14, 7))
             save_path: Optional path to save the figure (default: None)
                        Pass True to save to gross_gex.png
+            interactive: Reuse a cached Figure across calls (default: False)
 
         Returns:
             Tuple of (fig, ax)
@@ -57,7 +73,17 @@ class GrossGEX:
         if not self.timestamps:
             raise ValueError("No data to plot. Call load_and_calculate() first.")
 
-        fig, ax1 = plt.subplots(figsize=figsize)
+        # Interactive dashboards re-render on every new snapshot; reusing a
+        # cached Figure skips matplotlib's full figure setup on each call.
+        if interactive:
+            if self._fig is None:
+                self._fig = plt.figure(figsize=figsize)
+            self._fig.clf()
+            self._fig.set_size_inches(*figsize)
+            fig = self._fig
+            ax1 = fig.add_subplot(111)
+        else:
+            fig, ax1 = plt.subplots(figsize=figsize)
 
         # Plot GEX on primary axis
         ax1.plot(
@@ -120,21 +146,22 @@ class GrossGEX:
         if expiration_filter is None:
             raise ValueError("expiration_filter is required and cannot be None")
 
+        meta = scan_chain_metadata(self.data_dir)
+        mask = (meta["symbol"] == symbol) & (meta["expiration"] == pd.Timestamp(expiration_filter))
         if sample_date is not None:
-            pattern = f"{symbol}_exp{expiration_filter}_{sample_date}_*.csv"
-        else:
-            pattern = f"{symbol}_exp{expiration_filter}_*.csv"
+            mask &= meta["fetch_dt"].dt.normalize() == pd.Timestamp(sample_date)
+        meta = meta[mask]
 
-        csv_files = sorted(self.data_dir.glob(pattern))
+        snapshots = list(zip(meta["fetch_dt"], meta["file"]))
 
-        if not csv_files:
+        if not snapshots:
             filter_msg = f" for symbol {symbol}" if symbol else ""
             filter_msg += f" and expiration {expiration_filter}"
             raise ValueError(f"No option chain CSV files found in {self.data_dir}{filter_msg}")
 
         # Identify top 5 strikes by open interest from first file
-        if csv_files:
-            first_df = pd.read_csv(csv_files[0])
+        if snapshots:
+            first_df = downcast_chain(read_chain_csv(snapshots[0][1], usecols=SNAPSHOT_COLUMNS))
             if not first_df.empty and "underlying_price" in first_df.columns:
                 spot_first = float(first_df["underlying_price"].iloc[0])
                 # Filter to strike window
@@ -146,42 +173,49 @@ class GrossGEX:
                     # Get top 5 strikes by open interest
                     top5_df = band_first.nlargest(5, "open_interest")
                     self.top5_strikes = set(top5_df["strike"].values)
+                    self._top5_sorted = np.sort(np.asarray(list(self.top5_strikes), dtype=DTYPE))
 
-        for csv_file in csv_files:
-            try:
-                # Parse timestamp from filename: $SPX_exp2025-12-24_2025-12-18_14-30-00.csv
-                # Format: {symbol}_exp{expiration_date}_{fetch_date}_{fetch_time}.csv
-                parts = csv_file.stem.split("_")
-                if len(parts) >= 4:
-                    # Parts: ['$SPX', 'exp2025-12-24', '2025-12-18', '14-30-00']
-                    fetch_date = parts[2]
-                    fetch_time = parts[3]
-                    timestamp = datetime.strptime(f"{fetch_date}_{fetch_time}", "%Y-%m-%d_%H-%M-%S")
-                else:
-                    continue
-
-                df = pd.read_csv(csv_file)
-
-                # Calculate Gross GEX for this snapshot
-                gross_gex, strike_count = self._compute_net_gex_near_spot(df)
-
-                # Calculate Gross GEX for top 5 strikes if identified
-                top5_gex = 0.0
-                if self.top5_strikes:
-                    top5_gex = self._compute_top5_gex(df)
-
-                self.timestamps.append(timestamp)
-                self.net_gex_values.append(gross_gex)
-                self.strike_counts.append(strike_count)
-                self.top5_gex_values.append(top5_gex)
-
-            except Exception as e:
-                print(f"Warning: Error processing {csv_file.name}: {e}")
-                continue
+        # Snapshots are independent; read_csv releases the GIL in the parser,
+        # so a thread pool overlaps file reads with the GEX math.
+        with ThreadPoolExecutor(max_workers=min(16, os.cpu_count() or 1)) as executor:
+            results = [r for r in executor.map(self._process_snapshot, snapshots) if r is not None]
 
-        if not self.timestamps:
+        if not results:
             raise ValueError("No valid option chain data with timestamps found")
 
+        timestamps, net_gex_values, strike_counts, top5_gex_values = map(list, zip(*results))
+        self.timestamps.extend(timestamps)
+        self.net_gex_values.extend(net_gex_values)
+        self.strike_counts.extend(strike_counts)
+        self.top5_gex_values.extend(top5_gex_values)
+
+    def _process_snapshot(self, snapshot):
+        """Load one snapshot file and compute its Gross GEX metrics.
+
+        Args:
+            snapshot: Tuple of (timestamp, csv_file path)
+
+        Returns:
+            tuple: (timestamp, gross_gex, strike_count, top5_gex),
+                   or None if the file could not be processed
+        """
+        timestamp, csv_file = snapshot
+        try:
+            df = downcast_chain(read_chain_csv(csv_file, usecols=SNAPSHOT_COLUMNS))
+
+            # Calculate Gross GEX for this snapshot
+            gross_gex, strike_count = self._compute_net_gex_near_spot(df)
+
+            # Calculate Gross GEX for top 5 strikes if identified
+            top5_gex = 0.0
+            if self.top5_strikes:
+                top5_gex = self._compute_top5_gex(df)
+
+            return timestamp, gross_gex, strike_count, top5_gex
+        except Exception as e:
+            print(f"Warning: Error processing {csv_file.name}: {e}")
+            return None
+
     def _compute_net_gex_near_spot(self, df):
         """Compute near-spot Gross GEX for strikes within strike_width of spot.
 
@@ -199,10 +233,18 @@ class GrossGEX:
 
         spot = float(df["underlying_price"].iloc[0])
 
-        # Filter to near-spot strikes
-        band = df[
-            (df["strike"] >= spot - self.strike_width) & (df["strike"] <= spot + self.strike_width)
-        ]
+        # Slice the near-spot band out of the strike-sorted frame with two
+        # binary searches instead of materializing boolean masks per snapshot.
+        # Chain files interleave calls and puts, so sort by strike once here;
+        # the band stays a contiguous view either way.
+        strike = df["strike"].to_numpy()
+        if np.any(strike[:-1] > strike[1:]):
+            df = df.sort_values("strike", kind="stable")
+            strike = df["strike"].to_numpy()
+
+        lo = np.searchsorted(strike, spot - self.strike_width, side="left")
+        hi = np.searchsorted(strike, spot + self.strike_width, side="right")
+        band = df.iloc[lo:hi]
 
         strike_count = len(band)
         gross_gex = self._compute_net_gex(band, spot)
@@ -223,8 +265,25 @@ class GrossGEX:
         if df is None or df.empty:
             return 0.0
 
-        gross = row_gross_gex(df, spot, self.multiplier, self.gamma_scale)
-        return float(gross.sum())
+        gamma = df["gamma"].to_numpy()
+        open_interest = df["open_interest"].to_numpy()
+
+        n = len(gamma)
+        buf = getattr(self._scratch, "gex_buf", None)
+        if buf is None or buf.size < n:
+            buf = np.empty(max(n, 512))
+            self._scratch.gex_buf = buf
+
+        return float(
+            row_gross_gex_into(
+                buf[:n],
+                np.ascontiguousarray(gamma),
+                np.ascontiguousarray(open_interest),
+                spot,
+                float(self.multiplier),
+                float(self.gamma_scale),
+            )
+        )
 
     def _compute_top5_gex(self, df):
         """Compute Gross GEX for the top 5 strikes identified in first file.
@@ -243,11 +302,18 @@ class GrossGEX:
 
         spot = float(df["underlying_price"].iloc[0])
 
-        # Filter to only top 5 strikes
-        top5_df = df[df["strike"].isin(self.top5_strikes)]
+        # Membership test against the tiny sorted strike vector via
+        # searchsorted -- no per-value hashing like .isin(set), and the
+        # selected rows stay raw NumPy arrays all the way to the sum.
+        strike = df["strike"].to_numpy(dtype=DTYPE)
+        idx = np.searchsorted(self._top5_sorted, strike)
+        idx_clipped = np.minimum(idx, self._top5_sorted.size - 1)
+        mask = (idx < self._top5_sorted.size) & (self._top5_sorted[idx_clipped] == strike)
 
-        if top5_df.empty:
+        if not mask.any():
             return 0.0
 
-        gross = row_gross_gex(top5_df, spot, self.multiplier, self.gamma_scale)
-        return float(gross.sum())
+        gamma = df["gamma"].to_numpy(dtype=DTYPE)[mask]
+        open_interest = df["open_interest"].to_numpy(dtype=DTYPE)[mask]
+        gross = np.sum(gamma * open_interest, dtype=np.float64)
+        return float(gross * self.multiplier * self.gamma_scale * spot**2)
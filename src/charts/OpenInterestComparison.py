@@ -1,9 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from utils.option_chain_loader import read_chain_csv, scan_chain_metadata
+
+try:
+    # Optional: zero-copy concatenation of the per-expiration frames.
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    # Optional: parallel columnar groupby/pivot for the aggregation path.
+    import polars as pl
+except ImportError:
+    pl = None
+
 
 class OpenInterestComparison:
     """Open Interest Comparison charting utilities.
@@ -52,48 +68,98 @@ class OpenInterestComparison:
         Returns:
             Tuple of (fig, ax)
         """
+        oi_by_strike_exp = self._aggregate(contract_type, min_strike, max_strike, top_n_strikes)
+        return self._draw(oi_by_strike_exp, contract_type, figsize, save_path)
+
+    def _aggregate(self, contract_type="ALL", min_strike=None, max_strike=None, top_n_strikes=None):
+        """Build the pivoted OI-by-strike frame that plot renders.
+
+        Touches no Matplotlib state, so a dashboard can cache its result
+        (e.g. with st.cache_data) and redraw on every widget tick without
+        redoing the O(chain) aggregation.
+        """
         if self.df is None or self.df.empty:
             raise ValueError(
                 "No data to plot. Call load_data() first or provide dataframe in __init__"
             )
 
-        df_filtered = self.df.copy()
+        # Project to the columns the groupby needs; boolean indexing already
+        # returns a new frame, so the upfront full-frame copy was pure waste.
         if contract_type in ["CALL", "PUT"]:
-            df_filtered = df_filtered[df_filtered["contract_type"] == contract_type]
-        elif contract_type != "ALL":
+            df_filtered = self.df.loc[
+                self.df["contract_type"] == contract_type,
+                ["strike", "expiration_date", "open_interest"],
+            ]
+        elif contract_type == "ALL":
+            df_filtered = self.df[["strike", "expiration_date", "open_interest"]]
+        else:
             raise ValueError(
                 f"contract_type must be 'ALL', 'CALL', or 'PUT', got '{contract_type}'"
             )
 
-        oi_by_strike_exp = (
-            df_filtered.groupby(["strike", "expiration_date"])["open_interest"]
-            .sum()
-            .unstack(fill_value=0)
-        )
+        if pl is not None:
+            # Polars runs the groupby/pivot on all cores over Arrow columns;
+            # only the small pivoted result crosses back into pandas.
+            oi_by_strike_exp = (
+                pl.from_pandas(df_filtered)
+                .lazy()
+                .group_by(["strike", "expiration_date"])
+                .agg(pl.col("open_interest").sum())
+                .collect()
+                .pivot(index="strike", on="expiration_date", values="open_interest")
+                .fill_null(0)
+                .sort("strike")
+                .to_pandas()
+                .set_index("strike")
+            )
+        else:
+            # Categorical expirations group on integer codes instead of
+            # hashing date strings per row, and pivot_table aggregates
+            # straight into the wide layout rather than building a
+            # MultiIndex series and reshaping it with unstack.
+            df_filtered = df_filtered.assign(
+                expiration_date=df_filtered["expiration_date"].astype("category"),
+                open_interest=df_filtered["open_interest"].fillna(0).astype(np.int64, copy=False),
+            )
+            oi_by_strike_exp = df_filtered.pivot_table(
+                index="strike",
+                columns="expiration_date",
+                values="open_interest",
+                aggfunc="sum",
+                fill_value=0,
+                observed=True,
+                sort=False,
+            )
 
-        oi_by_strike_exp = oi_by_strike_exp.sort_index()
+        oi_by_strike_exp = oi_by_strike_exp.sort_index().sort_index(axis=1)
 
         if min_strike is not None or max_strike is not None:
-            if min_strike is not None and max_strike is not None:
-                oi_by_strike_exp = oi_by_strike_exp.loc[
-                    (oi_by_strike_exp.index >= min_strike) & (oi_by_strike_exp.index <= max_strike)
-                ]
-            elif min_strike is not None:
-                oi_by_strike_exp = oi_by_strike_exp.loc[oi_by_strike_exp.index >= min_strike]
-            elif max_strike is not None:
-                oi_by_strike_exp = oi_by_strike_exp.loc[oi_by_strike_exp.index <= max_strike]
+            # The frame is already strike-sorted: two binary searches and a
+            # slice instead of building and ANDing full boolean masks. Cast
+            # the bounds to the index dtype so searchsorted compares like
+            # with like at the window edges.
+            idx = oi_by_strike_exp.index.to_numpy()
+            lo = np.searchsorted(idx, idx.dtype.type(min_strike)) if min_strike is not None else 0
+            hi = (
+                np.searchsorted(idx, idx.dtype.type(max_strike), side="right")
+                if max_strike is not None
+                else len(idx)
+            )
+            oi_by_strike_exp = oi_by_strike_exp.iloc[lo:hi]
 
         # NOTE: filter to top N strikes by total open interest
         if top_n_strikes is not None:
-            # Calculate total OI across all expirations for each strike
-            total_oi_by_strike = oi_by_strike_exp.sum(axis=1)
-            # Get the top N strikes
-            top_strikes = total_oi_by_strike.nlargest(top_n_strikes).index
-            # Filter to only those strikes
-            oi_by_strike_exp = oi_by_strike_exp.loc[top_strikes]
-            # Re-sort by strike price
-            oi_by_strike_exp = oi_by_strike_exp.sort_index()
+            # O(N) argpartition instead of nlargest's full sort; taking the
+            # sorted positions keeps strike order without a second sort.
+            totals = oi_by_strike_exp.sum(axis=1).to_numpy()
+            k = min(top_n_strikes, totals.size)
+            top_idx = np.argpartition(totals, -k)[-k:]
+            oi_by_strike_exp = oi_by_strike_exp.iloc[np.sort(top_idx)]
+
+        return oi_by_strike_exp
 
+    def _draw(self, oi_by_strike_exp, contract_type, figsize, save_path):
+        """Render a prebuilt aggregate from _aggregate."""
         fig, ax = plt.subplots(figsize=figsize)
 
         oi_by_strike_exp.plot(kind="bar", stacked=False, ax=ax, width=0.8, colormap="tab20")
@@ -109,16 +175,13 @@ class OpenInterestComparison:
         ax.legend(title="Expiration", bbox_to_anchor=(1.05, 1), loc="upper left")
         ax.grid(True, alpha=0.3, axis="y")
 
-        ax.set_xticklabels(
-            [f"{int(strike)}" for strike in oi_by_strike_exp.index], rotation=45, ha="right"
-        )
-
-        # NOTE: Reduce number of x-ticks if too many strikes
-        if len(oi_by_strike_exp) > 50:
-            step = len(oi_by_strike_exp) // 25
-            for i, label in enumerate(ax.get_xticklabels()):
-                if i % step != 0:
-                    label.set_visible(False)
+        # Format the labels in C and set only the surviving ticks instead of
+        # hiding thinned labels one Matplotlib artist at a time.
+        idx = oi_by_strike_exp.index.to_numpy(np.int64)
+        step = max(1, len(idx) // 25) if len(idx) > 50 else 1
+        positions = np.arange(len(idx))[::step]
+        ax.set_xticks(positions)
+        ax.set_xticklabels(np.char.mod("%d", idx[::step]), rotation=45, ha="right")
 
         plt.tight_layout()
 
@@ -144,67 +207,68 @@ class OpenInterestComparison:
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = start_dt + timedelta(days=days_out)
 
-        # Find all CSV files for this symbol
-        months = [start_dt.month, (start_dt.month % 12) + 1]
-        years = [start_dt.year, start_dt.year if start_dt.month < 12 else start_dt.year + 1]
+        # One vectorized filename scan instead of a per-file strptime loop.
+        meta = scan_chain_metadata(self.data_dir)
+        meta = meta[meta["symbol"] == symbol]
 
-        csv_files = []
-        for m, y in zip(months, years):
-            month_str = f"{y:04d}-{m:02d}"
-            pattern = f"{symbol}_exp{month_str}*.csv"
-            csv_files.extend(sorted(self.data_dir.glob(pattern)))
-
-        if not csv_files:
+        if meta.empty:
             raise ValueError(
                 f"No option chain CSV files found for symbol {symbol} in {self.data_dir}"
             )
 
-        files_by_expiration = {}
-        for csv_file in csv_files:
-            try:
-                parts = csv_file.stem.split("_")
-                if len(parts) >= 4:
-                    exp_date_str = parts[1].replace("exp", "")
-                    exp_date = datetime.strptime(exp_date_str, "%Y-%m-%d")
-
-                    fetch_date = parts[2]
-                    fetch_time = parts[3]
-                    fetch_dt = datetime.strptime(f"{fetch_date}_{fetch_time}", "%Y-%m-%d_%H-%M-%S")
-
-                    if start_dt <= exp_date <= end_dt:
-                        if (
-                            exp_date_str not in files_by_expiration
-                            or fetch_dt > files_by_expiration[exp_date_str][0]
-                        ):
-                            files_by_expiration[exp_date_str] = (fetch_dt, csv_file)
-            except Exception:
-                continue
-
-        if not files_by_expiration:
+        meta = meta[(meta["expiration"] >= start_dt) & (meta["expiration"] <= end_dt)]
+
+        if meta.empty:
             raise ValueError(
                 f"No option chain files found with expirations between {start_date} and {end_dt.strftime('%Y-%m-%d')}"
             )
 
-        latest_files = [file_info[1] for file_info in files_by_expiration.values()]
+        # Latest snapshot per expiration in a single groupby/idxmax pass.
+        latest_files = meta.loc[meta.groupby("expiration")["fetch_dt"].idxmax(), "file"].tolist()
 
-        dfs = []
-        for csv_file in latest_files:
-            df_temp = pd.read_csv(csv_file)
+        # Column-projected reads: the chart only ever consumes four columns,
+        # so skip parsing the rest of each snapshot. The per-expiration reads
+        # are independent and the CSV parser releases the GIL, so a thread
+        # pool overlaps their IO and parse time.
+        def _read(csv_file):
+            return read_chain_csv(
+                csv_file, usecols=("contract_type", "expiration_date", "open_interest", "strike")
+            )
 
-            if not df_temp.empty:
-                dfs.append(df_temp)
+        with ThreadPoolExecutor(max_workers=min(8, len(latest_files))) as executor:
+            dfs = [df for df in executor.map(_read, latest_files) if not df.empty]
 
-        if dfs:
-            self.df = pd.concat(dfs, ignore_index=True)
-        else:
+        if not dfs:
             raise ValueError("All loaded dataframes are empty")
+
+        if pa is not None and len(dfs) > 1:
+            # Arrow concatenation chains the per-file buffers without
+            # copying them; a single to_pandas materializes the result once
+            # and self_destruct frees each chunk as it is converted.
+            tables = [pa.Table.from_pandas(df, preserve_index=False) for df in dfs]
+            self.df = pa.concat_tables(tables, promote_options="default").to_pandas(
+                self_destruct=True
+            )
+        else:
+            self.df = pd.concat(dfs, ignore_index=True)
         self._prepare_data()
 
         return self.df
 
     def _prepare_data(self):
         """Ensure numeric columns are parsed properly and aggregate by strike/expiration."""
-        numeric_columns = ["strike", "open_interest"]
-        for col in numeric_columns:
-            if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors="coerce")
+        # Downcast to the narrowest dtype that fits: the groupby/pivot chain
+        # is memory-bound, so halving column width halves the traffic.
+        if "strike" in self.df.columns:
+            self.df["strike"] = pd.to_numeric(self.df["strike"], errors="coerce", downcast="float")
+        if "open_interest" in self.df.columns:
+            self.df["open_interest"] = pd.to_numeric(
+                self.df["open_interest"], errors="coerce", downcast="integer"
+            )
+
+        # int8 code compares instead of per-row string hashing in the
+        # filters and groupbys downstream.
+        if "contract_type" in self.df.columns:
+            self.df["contract_type"] = self.df["contract_type"].astype(
+                pd.CategoricalDtype(categories=["CALL", "PUT"])
+            )
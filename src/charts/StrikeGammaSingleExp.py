@@ -4,6 +4,27 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from utils.option_chain_loader import read_chain_csv
+
+try:
+    # Optional: parallel JIT pass for the gex kernel on large chains.
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _gex_kernel(gamma, open_interest, spot, mult):
+        out = np.empty(gamma.shape[0], np.float32)
+        for i in prange(gamma.shape[0]):
+            out[i] = gamma[i] * open_interest[i] * spot[i] * spot[i] * mult
+        return out
+
+
+# Chains below this size finish faster in plain NumPy than a JIT dispatch.
+_JIT_MIN_ROWS = 50_000
+
 
 class StrikeGammaSingleExp:
     """Gamma Exposure (GEX) charting utilities.
@@ -123,21 +144,40 @@ class StrikeGammaSingleExp:
 
     def _prepare_data(self, cash=False):
         """Ensure numeric columns are parsed properly."""
-        numeric_columns = ["strike", "gamma", "open_interest", "underlying_price"]
-        for col in numeric_columns:
-            self.df[col] = pd.to_numeric(self.df[col], errors="coerce")
-
-        if cash:
-            self.df["gex"] = (
-                self.df["gamma"]
-                * self.df["open_interest"]
-                * self.MULTIPLIER
-                * (self.df["underlying_price"] ** 2)
+        # Downcast to the narrowest dtype that fits; the gex kernel below
+        # reads these as float32 anyway.
+        for col in ["strike", "gamma", "underlying_price"]:
+            self.df[col] = pd.to_numeric(self.df[col], errors="coerce", downcast="float")
+        self.df["open_interest"] = pd.to_numeric(
+            self.df["open_interest"], errors="coerce", downcast="integer"
+        )
+
+        # int8 code compares instead of per-row string hashing in the
+        # filters and groupbys downstream.
+        if "contract_type" in self.df.columns:
+            self.df["contract_type"] = self.df["contract_type"].astype(
+                pd.CategoricalDtype(categories=["CALL", "PUT"])
             )
-        else:
-            self.df["gex"] = (
-                self.df["gamma"] * self.df["open_interest"] * (self.df["underlying_price"] ** 2)
+
+        # One fused pass over the three columns into a preallocated float32
+        # buffer instead of a chain of pandas temporaries; large chains take
+        # the parallel numba kernel instead.
+        gamma = self.df["gamma"].to_numpy(np.float32, copy=False)
+        open_interest = self.df["open_interest"].to_numpy(np.float32)
+        spot = self.df["underlying_price"].to_numpy(np.float32, copy=False)
+        mult = float(self.MULTIPLIER) if cash else 1.0
+        if njit is not None and gamma.shape[0] > _JIT_MIN_ROWS:
+            out = _gex_kernel(
+                np.ascontiguousarray(gamma), open_interest, np.ascontiguousarray(spot), mult
             )
+        else:
+            out = np.empty_like(gamma)
+            np.multiply(gamma, open_interest, out=out)
+            np.multiply(out, spot, out=out)
+            np.multiply(out, spot, out=out)
+            if cash:
+                out *= mult
+        self.df["gex"] = out
 
     def calculate_gex_by_strike(self, min_strike=None, max_strike=None):
         """
@@ -147,19 +187,30 @@ class StrikeGammaSingleExp:
         Returns:
             DataFrame with columns: strike, CALL, PUT, net_gamma
         """
-        df = self.df.copy()
-
-        if min_strike is not None:
-            df = df[df["strike"] >= min_strike]
-        if max_strike is not None:
-            df = df[df["strike"] <= max_strike]
+        # Filter before copying: boolean slicing already returns a fresh
+        # frame, so only the plotted window is materialized instead of
+        # duplicating the whole chain upfront. The groupby below never
+        # mutates, so the unfiltered case can read self.df directly.
+        if min_strike is not None and max_strike is not None:
+            df = self.df[self.df["strike"].between(min_strike, max_strike)]
+        elif min_strike is not None:
+            df = self.df[self.df["strike"] >= min_strike]
+        elif max_strike is not None:
+            df = self.df[self.df["strike"] <= max_strike]
+        else:
+            df = self.df
 
-        # Pivot CALL / PUT into columns
+        # Pivot CALL / PUT into columns in one groupby+unstack pass instead
+        # of pivot -> fillna -> reset_index, each of which allocated an
+        # intermediate frame. The categorical key groups on int8 codes.
         gex_by_strike = (
-            df.pivot(index="strike", columns="contract_type", values="gex").fillna(0).reset_index()
+            df.groupby(["strike", "contract_type"], observed=True)["gex"]
+            .sum()
+            .unstack("contract_type", fill_value=0)
         )
 
         gex_by_strike["net_gamma"] = gex_by_strike.get("CALL", 0) - gex_by_strike.get("PUT", 0)
+        gex_by_strike = gex_by_strike.reset_index()
 
         return gex_by_strike
 
@@ -181,4 +232,4 @@ class StrikeGammaSingleExp:
 
         # Get the most recent file (sorted alphabetically by timestamp)
         latest_file = csv_files[-1]
-        self.df = pd.read_csv(latest_file)
+        self.df = read_chain_csv(latest_file)
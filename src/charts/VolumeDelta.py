@@ -1,8 +1,17 @@
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from utils.option_chain_loader import read_chain_csv
+
+try:
+    # Optional: parallel columnar groupby/pivot for the aggregation path.
+    import polars as pl
+except ImportError:
+    pl = None
+
 
 class VolumeDelta:
     def __init__(self, csv_path=None, dataframe=None, data_dir="data"):
@@ -45,139 +54,162 @@ class VolumeDelta:
         Returns:
             Tuple of (fig, axes)
         """
+        delta_data, volume_data = self._aggregate(
+            contract_type, min_strike, max_strike, top_n_strikes
+        )
+        return self._draw(delta_data, volume_data, contract_type, figsize, save_path)
+
+    def _aggregate(self, contract_type="ALL", min_strike=None, max_strike=None, top_n_strikes=None):
+        """Build the delta/volume aggregates that plot renders.
+
+        Touches no Matplotlib state, so a dashboard can cache its result
+        (e.g. with st.cache_data) and redraw on every widget tick without
+        redoing the O(chain) aggregation. Returns CALL/PUT frames for
+        contract_type "ALL" and per-strike Series otherwise.
+        """
         if self.df is None or self.df.empty:
             raise ValueError(
                 "No data to plot. Call load_data() first or provide dataframe in __init__"
             )
 
-        df_filtered = self.df.copy()
-
-        # Create two subplots side by side
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
-
-        if contract_type == "ALL":
-            call_delta = (
-                df_filtered[df_filtered["contract_type"] == "CALL"]
-                .groupby("strike")["volume_delta"]
-                .sum()
-            )
-            put_delta = (
-                df_filtered[df_filtered["contract_type"] == "PUT"]
-                .groupby("strike")["volume_delta"]
-                .sum()
+        if contract_type not in ["ALL", "CALL", "PUT"]:
+            raise ValueError(
+                f"contract_type must be 'ALL', 'CALL', or 'PUT', got '{contract_type}'"
             )
 
-            call_volume = (
-                df_filtered[df_filtered["contract_type"] == "CALL"]
-                .groupby("strike")["total_volume_latest"]
-                .sum()
-            )
-            put_volume = (
-                df_filtered[df_filtered["contract_type"] == "PUT"]
-                .groupby("strike")["total_volume_latest"]
-                .sum()
-            )
+        # Project to the columns the groupbys need; the filters below already
+        # allocate fresh frames, so the upfront full-frame copy was pure waste.
+        df_filtered = self.df[["contract_type", "strike", "volume_delta", "total_volume_latest"]]
 
-            # Combine into DataFrames with all strikes
-            all_strikes = sorted(set(call_delta.index) | set(put_delta.index))
-            delta_data = pd.DataFrame(
-                {
-                    "CALL": call_delta.reindex(all_strikes, fill_value=0),
-                    "PUT": put_delta.reindex(all_strikes, fill_value=0),
-                }
-            )
-            volume_data = pd.DataFrame(
-                {
-                    "CALL": call_volume.reindex(all_strikes, fill_value=0),
-                    "PUT": put_volume.reindex(all_strikes, fill_value=0),
-                }
-            )
+        if contract_type == "ALL":
+            if pl is not None:
+                # One parallel groupby over Arrow columns covers all four of
+                # the per-type sums; only the tiny pivoted results come back.
+                agg = (
+                    pl.from_pandas(df_filtered)
+                    .lazy()
+                    .group_by(["strike", "contract_type"])
+                    .agg(
+                        pl.col("volume_delta").sum(),
+                        pl.col("total_volume_latest").sum(),
+                    )
+                    .collect()
+                )
+                delta_data = (
+                    agg.pivot(index="strike", on="contract_type", values="volume_delta")
+                    .fill_null(0)
+                    .sort("strike")
+                    .to_pandas()
+                    .set_index("strike")
+                    .reindex(columns=["CALL", "PUT"], fill_value=0)
+                )
+                volume_data = (
+                    agg.pivot(index="strike", on="contract_type", values="total_volume_latest")
+                    .fill_null(0)
+                    .sort("strike")
+                    .to_pandas()
+                    .set_index("strike")
+                    .reindex(columns=["CALL", "PUT"], fill_value=0)
+                )
+            else:
+                # One two-key groupby covers all four per-type sums: a single
+                # hash build and one pass over the data instead of four
+                # filter-then-groupby scans.
+                agg = df_filtered.groupby(["contract_type", "strike"], observed=True).agg(
+                    vd=("volume_delta", "sum"), vol=("total_volume_latest", "sum")
+                )
+                delta_data = (
+                    agg["vd"]
+                    .unstack("contract_type", fill_value=0)
+                    .reindex(columns=["CALL", "PUT"], fill_value=0)
+                )
+                volume_data = (
+                    agg["vol"]
+                    .unstack("contract_type", fill_value=0)
+                    .reindex(columns=["CALL", "PUT"], fill_value=0)
+                )
 
             if min_strike is not None or max_strike is not None:
-                if min_strike is not None and max_strike is not None:
-                    delta_data = delta_data.loc[
-                        (delta_data.index >= min_strike) & (delta_data.index <= max_strike)
-                    ]
-                    volume_data = volume_data.loc[
-                        (volume_data.index >= min_strike) & (volume_data.index <= max_strike)
-                    ]
-                elif min_strike is not None:
-                    delta_data = delta_data.loc[delta_data.index >= min_strike]
-                    volume_data = volume_data.loc[volume_data.index >= min_strike]
-                elif max_strike is not None:
-                    delta_data = delta_data.loc[delta_data.index <= max_strike]
-                    volume_data = volume_data.loc[volume_data.index <= max_strike]
-
-            # Filter to top N strikes by absolute volume delta
-            if top_n_strikes is not None:
-                total_abs_delta = delta_data.abs().sum(axis=1)
-                top_strikes = total_abs_delta.nlargest(top_n_strikes).index
-                delta_data = delta_data.loc[top_strikes]
-                volume_data = volume_data.loc[top_strikes]
-                delta_data = delta_data.sort_index()
-                volume_data = volume_data.sort_index()
-
-            # Plot volume delta
-            delta_data.plot(kind="bar", ax=ax1, width=0.8, color=["green", "red"])
-
-            # Plot latest volume
-            volume_data.plot(kind="bar", ax=ax2, width=0.8, color=["green", "red"])
-
-            strikes = delta_data.index
-
-        else:
-            if contract_type not in ["CALL", "PUT"]:
-                raise ValueError(
-                    f"contract_type must be 'ALL', 'CALL', or 'PUT', got '{contract_type}'"
+                # Both frames share a sorted strike index: binary-search the
+                # two cut points and slice instead of ANDing boolean masks.
+                idx = delta_data.index.to_numpy()
+                lo = (
+                    np.searchsorted(idx, idx.dtype.type(min_strike))
+                    if min_strike is not None
+                    else 0
                 )
+                hi = (
+                    np.searchsorted(idx, idx.dtype.type(max_strike), side="right")
+                    if max_strike is not None
+                    else len(idx)
+                )
+                delta_data = delta_data.iloc[lo:hi]
+                volume_data = volume_data.iloc[lo:hi]
 
-            df_filtered = df_filtered[df_filtered["contract_type"] == contract_type]
-            delta_by_strike = df_filtered.groupby("strike")["volume_delta"].sum().sort_index()
-            volume_by_strike = (
-                df_filtered.groupby("strike")["total_volume_latest"].sum().sort_index()
-            )
-
-            if min_strike is not None or max_strike is not None:
-                if min_strike is not None and max_strike is not None:
-                    delta_by_strike = delta_by_strike.loc[
-                        (delta_by_strike.index >= min_strike)
-                        & (delta_by_strike.index <= max_strike)
-                    ]
-                    volume_by_strike = volume_by_strike.loc[
-                        (volume_by_strike.index >= min_strike)
-                        & (volume_by_strike.index <= max_strike)
-                    ]
-                elif min_strike is not None:
-                    delta_by_strike = delta_by_strike.loc[delta_by_strike.index >= min_strike]
-                    volume_by_strike = volume_by_strike.loc[volume_by_strike.index >= min_strike]
-                elif max_strike is not None:
-                    delta_by_strike = delta_by_strike.loc[delta_by_strike.index <= max_strike]
-                    volume_by_strike = volume_by_strike.loc[volume_by_strike.index <= max_strike]
-
-            # Filter to top N strikes by absolute volume delta
+            # Filter to top N strikes by absolute volume delta: O(N)
+            # argpartition instead of nlargest's full sort, with positions
+            # pre-sorted to keep strike order.
             if top_n_strikes is not None:
-                top_strikes = delta_by_strike.abs().nlargest(top_n_strikes).index
-                delta_by_strike = delta_by_strike.loc[top_strikes]
-                volume_by_strike = volume_by_strike.loc[top_strikes]
-                delta_by_strike = delta_by_strike.sort_index()
-                volume_by_strike = volume_by_strike.sort_index()
+                totals = delta_data.abs().sum(axis=1).to_numpy()
+                k = min(top_n_strikes, totals.size)
+                top_idx = np.sort(np.argpartition(totals, -k)[-k:])
+                delta_data = delta_data.iloc[top_idx]
+                volume_data = volume_data.iloc[top_idx]
+
+            return delta_data, volume_data
+
+        df_filtered = df_filtered[df_filtered["contract_type"] == contract_type]
+        delta_by_strike = df_filtered.groupby("strike")["volume_delta"].sum().sort_index()
+        volume_by_strike = df_filtered.groupby("strike")["total_volume_latest"].sum().sort_index()
+
+        if min_strike is not None or max_strike is not None:
+            # Same sorted-index slice as the ALL branch.
+            idx = delta_by_strike.index.to_numpy()
+            lo = np.searchsorted(idx, idx.dtype.type(min_strike)) if min_strike is not None else 0
+            hi = (
+                np.searchsorted(idx, idx.dtype.type(max_strike), side="right")
+                if max_strike is not None
+                else len(idx)
+            )
+            delta_by_strike = delta_by_strike.iloc[lo:hi]
+            volume_by_strike = volume_by_strike.iloc[lo:hi]
+
+        # Filter to top N strikes by absolute volume delta (same O(N)
+        # argpartition selection as the ALL branch).
+        if top_n_strikes is not None:
+            totals = delta_by_strike.abs().to_numpy()
+            k = min(top_n_strikes, totals.size)
+            top_idx = np.sort(np.argpartition(totals, -k)[-k:])
+            delta_by_strike = delta_by_strike.iloc[top_idx]
+            volume_by_strike = volume_by_strike.iloc[top_idx]
+
+        return delta_by_strike, volume_by_strike
+
+    def _draw(self, delta_data, volume_data, contract_type, figsize, save_path):
+        """Render prebuilt aggregates from _aggregate."""
+        # Create two subplots side by side
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
 
-            color = "green" if contract_type == "CALL" else "red"
+        if contract_type == "ALL":
+            colors = ["green", "red"]
+        else:
+            colors = "green" if contract_type == "CALL" else "red"
 
-            # Plot volume delta
-            delta_by_strike.plot(kind="bar", ax=ax1, width=0.8, color=color)
+        # Plot volume delta
+        delta_data.plot(kind="bar", ax=ax1, width=0.8, color=colors)
 
-            # Plot latest volume
-            volume_by_strike.plot(kind="bar", ax=ax2, width=0.8, color=color)
+        # Plot latest volume
+        volume_data.plot(kind="bar", ax=ax2, width=0.8, color=colors)
 
-            strikes = delta_by_strike.index
+        strikes = delta_data.index
 
         # Add vertical line at spot price for both subplots
         if "underlying_price" in self.df.columns:
             spot_price = self.df["underlying_price"].iloc[0]
-            strike_positions = {strike: i for i, strike in enumerate(strikes)}
-            closest_strike = min(strikes, key=lambda x: abs(x - spot_price))
-            spot_position = strike_positions[closest_strike]
+            # One NumPy argmin pass instead of a Python min-with-key scan
+            # plus a strike->position dict build.
+            strikes_arr = np.asarray(strikes, dtype=np.float32)
+            spot_position = int(np.abs(strikes_arr - np.float32(spot_price)).argmin())
 
             for ax in [ax1, ax2]:
                 ax.axvline(
@@ -229,14 +261,15 @@ class VolumeDelta:
         ax1.set_ylim(global_min, global_max)
         ax2.set_ylim(global_min, global_max)
 
-        # Set x-tick labels for both subplots
+        # Set x-tick labels for both subplots: format in C and keep only the
+        # ticks at multiples of 10 strikes instead of hiding labels one
+        # Matplotlib artist at a time.
+        idx = strikes.to_numpy(np.int64)
+        keep = np.flatnonzero(idx % 10 == 0)
+        labels = np.char.mod("%d", idx[keep])
         for ax in [ax1, ax2]:
-            ax.set_xticklabels([f"{int(strike)}" for strike in strikes], rotation=45, ha="right")
-
-            # Show ticks at multiples of 10 strikes
-            for i, (label, strike) in enumerate(zip(ax.get_xticklabels(), strikes)):
-                if int(strike) % 10 != 0:
-                    label.set_visible(False)
+            ax.set_xticks(keep)
+            ax.set_xticklabels(labels, rotation=45, ha="right")
 
         plt.tight_layout()
 
@@ -282,33 +315,50 @@ class VolumeDelta:
         print("Latest snapshot file:", latest_file)
         print("Previous snapshot file:", previous_file)
 
-        # Load both snapshots
-        latest_df = pd.read_csv(latest_file)
-        previous_df = pd.read_csv(previous_file)
+        # Load both snapshots, parsing only the columns the merge consumes.
+        latest_df = read_chain_csv(
+            latest_file,
+            usecols=(
+                "contract_type",
+                "strike",
+                "total_volume",
+                "expiration_date",
+                "underlying_price",
+            ),
+        )
+        previous_df = read_chain_csv(
+            previous_file, usecols=("contract_type", "strike", "total_volume")
+        )
 
         if latest_df.empty or previous_df.empty:
             raise ValueError("One or both snapshot files are empty")
 
-        # Calculate volume delta for each contract
-        # Merge on contract identifier (strike + contract_type)
-        latest_df = latest_df[
-            ["contract_type", "strike", "total_volume", "expiration_date", "underlying_price"]
-        ]
-        previous_df = previous_df[["contract_type", "strike", "total_volume"]]
+        # Pre-sort both frames on the join key so pandas takes the linear
+        # merge-join path over sorted keys instead of hashing, and switch
+        # outer -> left: only contracts present in the latest snapshot matter
+        # for the delta display. New contracts get a previous volume of 0.
+        latest_df = latest_df.sort_values(
+            ["contract_type", "strike"], kind="mergesort", ignore_index=True
+        )
+        previous_df = previous_df.sort_values(
+            ["contract_type", "strike"], kind="mergesort", ignore_index=True
+        )
 
         merged = latest_df.merge(
             previous_df,
             on=["contract_type", "strike"],
-            how="outer",
+            how="left",
+            sort=False,
             suffixes=("_latest", "_previous"),
+            validate="one_to_one",
         )
-
-        # Fill NaN with 0 (for new contracts that didn't exist in previous snapshot)
-        # merged["total_volume_latest"] = merged["total_volume_latest"].fillna(0)
-        # merged["total_volume_previous"] = merged["total_volume_previous"].fillna(0)
-
-        # Calculate delta
-        merged["volume_delta"] = merged["total_volume_latest"] - merged["total_volume_previous"]
+        # Calculate delta on ndarray views: the previous-volume fill for
+        # newly listed contracts is folded into the extraction, and the
+        # subtract skips Series alignment entirely.
+        latest_volume = merged["total_volume_latest"].to_numpy(np.float64, copy=False)
+        previous_volume = merged["total_volume_previous"].to_numpy(np.float64, na_value=0.0)
+        merged["total_volume_previous"] = previous_volume
+        merged["volume_delta"] = np.subtract(latest_volume, previous_volume)
 
         self.df = merged
         self._prepare_data()
@@ -317,7 +367,20 @@ class VolumeDelta:
 
     def _prepare_data(self):
         """Ensure numeric columns are parsed properly."""
-        numeric_columns = ["strike", "volume_delta", "underlying_price"]
-        for col in numeric_columns:
+        # Downcast to the narrowest dtype that fits: the aggregation path is
+        # memory-bound, so halving column width halves the traffic.
+        float_columns = ["strike", "volume_delta", "underlying_price"]
+        for col in float_columns:
             if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors="coerce")
+                self.df[col] = pd.to_numeric(self.df[col], errors="coerce", downcast="float")
+        count_columns = ["total_volume_latest", "total_volume_previous"]
+        for col in count_columns:
+            if col in self.df.columns:
+                self.df[col] = pd.to_numeric(self.df[col], errors="coerce", downcast="integer")
+
+        # int8 code compares instead of per-row string hashing in the
+        # filters and groupbys downstream.
+        if "contract_type" in self.df.columns:
+            self.df["contract_type"] = self.df["contract_type"].astype(
+                pd.CategoricalDtype(categories=["CALL", "PUT"])
+            )
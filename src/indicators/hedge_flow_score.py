@@ -7,6 +7,73 @@ Based on the methodology described in GEX_INTRADAY_DECISION_METRIC.md
 import numpy as np
 import pandas as pd
 
+try:
+    # Optional: JIT-compiles the HFS reduction into one parallel pass.
+    from numba import float64, njit, prange, types
+except ImportError:
+    njit = None
+
+
+def _hfs_kernel_py(strike, gamma, oi, is_call, spot, spot_window_pct, dealer_position):
+    """Pure-NumPy fallback for the HFS reduction (same math as the JIT kernel)."""
+    window_half = spot_window_pct / 2.0
+    in_window = (strike >= spot * (1 - window_half)) & (strike <= spot * (1 + window_half))
+    gamma_exposure = np.where(in_window, oi * gamma * 100.0 * spot, 0.0)
+
+    call_gamma = gamma_exposure[is_call].sum()
+    put_gamma = gamma_exposure[~is_call].sum()
+    total_gamma = np.abs(gamma_exposure).sum()
+
+    if total_gamma == 0:
+        return 0.0
+
+    hfs_norm = dealer_position * (call_gamma - put_gamma) / total_gamma
+    return min(max(hfs_norm, -1.0), 1.0)
+
+
+if njit is not None:
+    # The explicit signature forces eager compilation at import, and
+    # cache=True persists the compiled kernel on disk, so no snapshot --
+    # not even the first of a fresh process -- pays JIT latency. The
+    # array parameters are declared readonly because to_numpy() hands out
+    # read-only views under pandas copy-on-write (enabled globally by
+    # option_chain_loader); writable arrays coerce to readonly fine.
+    _f64_ro = types.Array(types.float64, 1, "C", readonly=True)
+    _bool_ro = types.Array(types.boolean, 1, "C", readonly=True)
+
+    @njit(
+        float64(_f64_ro, _f64_ro, _f64_ro, _bool_ro, float64, float64, float64),
+        cache=True,
+        fastmath=True,
+        parallel=True,
+    )
+    def _hfs_kernel(strike, gamma, oi, is_call, spot, spot_window_pct, dealer_position):
+        """Fused parallel reduction over the strike window: one pass, no temporaries."""
+        window_half = spot_window_pct / 2.0
+        lower_bound = spot * (1 - window_half)
+        upper_bound = spot * (1 + window_half)
+
+        call_gamma = 0.0
+        put_gamma = 0.0
+        total_gamma = 0.0
+        for i in prange(strike.shape[0]):
+            if lower_bound <= strike[i] <= upper_bound:
+                gamma_exposure = oi[i] * gamma[i] * 100.0 * spot
+                if is_call[i]:
+                    call_gamma += gamma_exposure
+                else:
+                    put_gamma += gamma_exposure
+                total_gamma += abs(gamma_exposure)
+
+        if total_gamma == 0.0:
+            return 0.0
+
+        hfs_norm = dealer_position * (call_gamma - put_gamma) / total_gamma
+        return min(max(hfs_norm, -1.0), 1.0)
+
+else:
+    _hfs_kernel = _hfs_kernel_py
+
 
 def calculate_hfs(
     df: pd.DataFrame,
@@ -69,56 +136,36 @@ def calculate_hfs(
     if df.empty:
         return 0.0
 
-    spot = df["underlying_price"].iloc[0]
-
-    # Step 1: Select local strike window around spot
-    # Default: ±0.5% (window_pct=0.01 means ±0.5%)
-    window_half = spot_window_pct / 2.0
-    lower_bound = spot * (1 - window_half)
-    upper_bound = spot * (1 + window_half)
+    spot = float(df["underlying_price"].iloc[0])
 
-    local_df = df[(df["strike"] >= lower_bound) & (df["strike"] <= upper_bound)].copy()
-
-    if local_df.empty:
-        return 0.0
-
-    # Step 2: Compute signed local dealer gamma
-    # Formula: Γ_local = Σ (s_i · OI_i · Γ_i · 100 · S)
-    # where s_i is the sign based on dealer positioning assumption
+    # Steps 1-4 run as one fused reduction in _hfs_kernel:
+    # 1. Select local strike window around spot (default ±0.5%)
+    # 2. Signed local dealer gamma: Γ_local = s · Σ (OI_i · Γ_i · 100 · S)
+    #    For SPX, dealers are typically SHORT options (sell to customers), so:
+    #    - Calls: dealers short calls → when spot rises, they buy (stabilizing)
+    #    - Puts: dealers short puts → when spot falls, they sell (destabilizing)
+    # 3. Expected hedge flow: HFS = Γ_local · ΔS with ΔS = spot · reference_move_pct
+    # 4. Normalize: HFS_norm = HFS / (Σ |OI_i · Γ_i · 100 · S| · ΔS), clamped to [-1, +1]
     #
-    # For SPX, dealers are typically SHORT options (sell to customers), so:
-    # - Calls: dealers short calls → when spot rises, they buy (stabilizing)
-    # - Puts: dealers short puts → when spot falls, they sell (destabilizing)
-    #
-    # Net effect depends on whether call or put gamma dominates at current strikes
-    MULTIPLIER = 100  # Standard options contract multiplier
-    local_df["gamma_exposure"] = local_df["open_interest"] * local_df["gamma"] * MULTIPLIER * spot
-
-    call_gamma = local_df[local_df["contract_type"] == "CALL"]["gamma_exposure"].sum()
-    put_gamma = local_df[local_df["contract_type"] == "PUT"]["gamma_exposure"].sum()
-    # Net dealer gamma with sign convention (dealers short options)
-    gamma_local = dealer_position * (call_gamma - put_gamma)
-
-    # Step 3: Translate gamma into expected hedge flow
-    # Formula: HFS = Γ_local · ΔS
-    # where ΔS is the reference move (e.g., 0.25% of spot)
-    delta_s = spot * reference_move_pct
-    hfs = gamma_local * delta_s
-
-    # Step 4: Normalize to obtain bounded decision score
-    # Formula: HFS_norm = HFS / (Σ |OI_i · Γ_i| · ΔS)
-    # The denominator represents total gamma exposure (unsigned)
-    total_gamma = local_df["gamma_exposure"].abs().sum()
-
-    if total_gamma == 0:
-        return 0.0
-
-    hfs_norm = hfs / (total_gamma * delta_s)
-
-    # Clamp to [-1, +1] range for safety
-    hfs_norm = np.clip(hfs_norm, -1.0, 1.0)
-
-    return hfs_norm
+    # The ΔS factor cancels in the normalized score, so reference_move_pct does
+    # not appear in the kernel; it is kept in the signature for the step-3
+    # formula and for callers that tune the reference move.
+    strike = df["strike"].to_numpy(dtype=np.float64)
+    gamma = df["gamma"].to_numpy(dtype=np.float64)
+    open_interest = df["open_interest"].to_numpy(dtype=np.float64)
+    is_call = df["contract_type"].to_numpy() == "CALL"
+
+    return float(
+        _hfs_kernel(
+            strike,
+            gamma,
+            open_interest,
+            is_call,
+            spot,
+            float(spot_window_pct),
+            float(dealer_position),
+        )
+    )
 
 
 def interpret_hfs(hfs_score: float) -> dict:
@@ -1,6 +1,13 @@
 """Utility modules for trade_lab."""
 
-from .black_scholes import bs_gamma, norm_pdf
+from .black_scholes import (
+    bs_gamma,
+    bs_implied_vol,
+    bs_implied_vol_greeks,
+    bs_price,
+    norm_cdf,
+    norm_pdf,
+)
 from .intraday import (
     calculate_net_gex_window,
     calculate_zero_gamma_line,
@@ -8,6 +15,7 @@ from .intraday import (
     get_atm_iv,
     load_intraday_option_samples,
 )
+from .option_chain_loader import load_option_chains
 from .volume import (
     calculate_dollar_volume,
     filter_trading_hours,
@@ -17,7 +25,12 @@ from .volume import (
 
 __all__ = [
     "bs_gamma",
+    "bs_implied_vol",
+    "bs_implied_vol_greeks",
+    "bs_price",
+    "norm_cdf",
     "norm_pdf",
+    "load_option_chains",
     "calculate_net_gex_window",
     "calculate_zero_gamma_line",
     "find_closest_expiration",
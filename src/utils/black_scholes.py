@@ -1,4 +1,8 @@
 import numpy as np
+from scipy.special import ndtr
+
+# Hoisted out of the per-call path: 1/sqrt(2*pi).
+_INV_SQRT_2PI = 0.3989422804014327
 
 
 def norm_pdf(x):
@@ -13,7 +17,23 @@ def norm_pdf(x):
     Returns:
         PDF value(s) at x: (1/√(2π)) * e^(-x²/2)
     """
-    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+    return np.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+def norm_cdf(x):
+    """
+    Calculate the standard normal cumulative distribution function (CDF).
+
+    Routed through scipy.special.ndtr, the raw C implementation behind
+    scipy.stats.norm.cdf without the distribution-object dispatch overhead.
+
+    Args:
+        x: Input value(s), can be scalar or numpy array
+
+    Returns:
+        CDF value(s) at x: P(Z <= x) for Z ~ N(0, 1)
+    """
+    return ndtr(x)
 
 
 def bs_gamma(s, k, t, sigma, r=0.0, q=0.0):
@@ -48,5 +68,163 @@ def bs_gamma(s, k, t, sigma, r=0.0, q=0.0):
     t = np.maximum(t, eps)
     sigma = np.maximum(sigma, eps)
 
-    d1 = (np.log(s / k) + (r - q + 0.5 * sigma**2) * t) / (sigma * np.sqrt(t))
-    return norm_pdf(d1) / (s * sigma * np.sqrt(t))
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(s / k) + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+    return norm_pdf(d1) / (s * sigma * sqrt_t)
+
+
+def bs_price(s, k, t, sigma, is_call=True, r=0.0, q=0.0):
+    """
+    Calculate the Black-Scholes price of a European option.
+
+    Args:
+        s: Spot price of the underlying (S)
+        k: Strike price (K)
+        t: Time to expiration in years (T)
+        sigma: Implied volatility as a decimal (e.g., 0.20 for 20%)
+        is_call: True for calls, False for puts (scalar or boolean array)
+        r: Risk-free interest rate as a decimal (default: 0.0)
+        q: Dividend yield as a decimal (default: 0.0)
+
+    Returns:
+        Option price(s). All inputs can be scalars or numpy arrays.
+    """
+    eps = 1e-12
+    s = np.maximum(s, eps)
+    k = np.maximum(k, eps)
+    t = np.maximum(t, eps)
+    sigma = np.maximum(sigma, eps)
+
+    sqrt_t = np.sqrt(t)
+    disc_r = np.exp(-r * t)
+    disc_q = np.exp(-q * t)
+    d1 = (np.log(s / k) + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    call = s * disc_q * norm_cdf(d1) - k * disc_r * norm_cdf(d2)
+    # Puts via put-call parity: P = C - S e^{-qT} + K e^{-rT}
+    return np.where(is_call, call, call - s * disc_q + k * disc_r)
+
+
+def bs_implied_vol(price, s, k, t, is_call=True, r=0.0, q=0.0, max_iter=20, tol=1e-6, seed=None):
+    """
+    Solve for Black-Scholes implied volatility with Newton-Raphson.
+
+    Each Newton step uses the analytic vega as the derivative and is fully
+    vectorized: one iteration prices every contract at once through NumPy
+    broadcasting, so a whole chain solves in the same handful of passes as
+    a single option. The solver seeds from the Manaster-Koehler estimate
+    and typically converges in 4-6 iterations, far fewer Black-Scholes
+    evaluations than a bracketing solver over [0.01, 5.0].
+
+    Args:
+        price: Observed option price(s)
+        s: Spot price of the underlying (S)
+        k: Strike price (K)
+        t: Time to expiration in years (T)
+        is_call: True for calls, False for puts (scalar or boolean array)
+        r: Risk-free interest rate as a decimal (default: 0.0)
+        q: Dividend yield as a decimal (default: 0.0)
+        max_iter: Maximum Newton iterations (default: 20)
+        tol: Price-space convergence tolerance (default: 1e-6)
+        seed: Optional warm-start vol(s), e.g. the previous snapshot's IV;
+              markets move little between snapshots so a prior solution
+              typically converges in 1-2 iterations instead of 4-6.
+              NaN entries fall back to the Manaster-Koehler seed.
+
+    Returns:
+        Implied volatility value(s); NaN where no vol in [1e-4, 5.0]
+        reproduces the observed price.
+    """
+    iv, _, _ = bs_implied_vol_greeks(
+        price, s, k, t, is_call=is_call, r=r, q=q, max_iter=max_iter, tol=tol, seed=seed
+    )
+    return iv
+
+
+def bs_implied_vol_greeks(
+    price, s, k, t, is_call=True, r=0.0, q=0.0, max_iter=20, tol=1e-6, seed=None
+):
+    """
+    Solve implied volatility and return delta and gamma in the same pass.
+
+    Identical Newton iteration to bs_implied_vol, but the d1 already
+    evaluated at the converged vol is reused for the greeks instead of
+    re-running the log/sqrt/CDF chain a second time per contract.
+
+    Args:
+        Same as bs_implied_vol.
+
+    Returns:
+        Tuple of (iv, delta, gamma) arrays; all three are NaN where the
+        solver could not reproduce the observed price.
+    """
+    eps = 1e-12
+    price = np.asarray(price, dtype=float)
+    s = np.maximum(np.asarray(s, dtype=float), eps)
+    k = np.maximum(np.asarray(k, dtype=float), eps)
+    t = np.maximum(np.asarray(t, dtype=float), eps)
+
+    # Everything sigma-independent is hoisted out of the Newton loop; each
+    # iteration only recomputes the sigma-dependent terms.
+    log_sk = np.log(s / k)
+    sqrt_t = np.sqrt(t)
+    disc_r = np.exp(-r * t)
+    disc_q = np.exp(-q * t)
+
+    # Manaster-Koehler seed, clipped away from the zero-vega plateau;
+    # warm-start entries from a prior solve override it where finite.
+    sigma = np.clip(np.sqrt(2.0 * np.abs(log_sk + r * t) / t), 0.05, 2.0)
+    if seed is not None:
+        seed = np.asarray(seed, dtype=float)
+        sigma = np.where(np.isfinite(seed), np.clip(seed, 1e-4, 5.0), sigma)
+    sigma = np.broadcast_to(sigma, np.broadcast_shapes(sigma.shape, price.shape)).copy()
+
+    for _ in range(max_iter):
+        d1 = (log_sk + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+        d2 = d1 - sigma * sqrt_t
+        call = s * disc_q * norm_cdf(d1) - k * disc_r * norm_cdf(d2)
+        diff = np.where(is_call, call, call - s * disc_q + k * disc_r) - price
+        if np.all(np.abs(diff) < tol):
+            break
+        vega = s * disc_q * sqrt_t * norm_pdf(d1)
+        sigma = np.clip(sigma - diff / np.maximum(vega, eps), 1e-4, 5.0)
+
+    # One final evaluation at the converged sigma feeds the fit check and
+    # the greeks alike.
+    d1 = (log_sk + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    call = s * disc_q * norm_cdf(d1) - k * disc_r * norm_cdf(d2)
+    final = np.where(is_call, call, call - s * disc_q + k * disc_r)
+
+    unfit = np.abs(final - price) > 1e-4
+    if np.any(unfit):
+        # Bisection rescue for quotes Newton could not fit (flat-vega wings
+        # where a Newton step overshoots). Price is monotone in vol, so
+        # bisect a bracket derived from the Manaster-Koehler seed, widened
+        # to the full [1e-4, 5] domain where it fails to straddle the quote.
+        mk = np.clip(np.sqrt(2.0 * np.abs(log_sk + r * t) / t), 0.05, 2.0)
+        lo = np.maximum(1e-4, 0.25 * mk)
+        hi = np.minimum(5.0, 4.0 * mk)
+        p_lo = bs_price(s, k, t, lo, is_call=is_call, r=r, q=q)
+        p_hi = bs_price(s, k, t, hi, is_call=is_call, r=r, q=q)
+        bad_bracket = (p_lo > price) | (p_hi < price)
+        lo = np.where(bad_bracket, 1e-4, lo)
+        hi = np.where(bad_bracket, 5.0, hi)
+        for _ in range(40):
+            mid = 0.5 * (lo + hi)
+            too_high = bs_price(s, k, t, mid, is_call=is_call, r=r, q=q) >= price
+            hi = np.where(too_high, mid, hi)
+            lo = np.where(too_high, lo, mid)
+        sigma = np.where(unfit, 0.5 * (lo + hi), sigma)
+
+        d1 = (log_sk + (r - q + 0.5 * sigma**2) * t) / (sigma * sqrt_t)
+        d2 = d1 - sigma * sqrt_t
+        call = s * disc_q * norm_cdf(d1) - k * disc_r * norm_cdf(d2)
+        final = np.where(is_call, call, call - s * disc_q + k * disc_r)
+
+    # NaN out contracts no vol can fit (stale or arbitrage quotes).
+    fit = np.abs(final - price) <= 1e-4
+    iv = np.where(fit, sigma, np.nan)
+    delta = np.where(fit, disc_q * np.where(is_call, norm_cdf(d1), norm_cdf(d1) - 1.0), np.nan)
+    gamma = np.where(fit, disc_q * norm_pdf(d1) / (s * sigma * sqrt_t), np.nan)
+    return iv, delta, gamma
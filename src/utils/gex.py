@@ -1,9 +1,66 @@
 """Shared gamma exposure calculation utilities."""
 
+from collections import OrderedDict
+
 import numpy as np
-import pandas as pd
+
 from .intraday import calculate_zero_gamma_line
 
+try:
+    # Optional: fuses the per-row GEX product and its sum into one JIT pass.
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Intraday snapshot loops (GrossGEX, DGI) recompute GEX for chains whose
+# gamma/OI grid is identical between timestamps -- only spot moves. Cache the
+# spot-invariant per-row factor keyed by the raw array bytes, LRU-bounded.
+_BASIS_CACHE_MAX = 16
+_basis_cache: OrderedDict = OrderedDict()
+
+
+def _spot_invariant_basis(gamma, open_interest, multiplier, gamma_scale):
+    """Per-row gamma * OI * multiplier * gamma_scale factor, cached across calls."""
+    key = (hash(gamma.tobytes() + open_interest.tobytes()), multiplier, gamma_scale)
+    basis = _basis_cache.get(key)
+    if basis is None:
+        basis = gamma * open_interest * multiplier * gamma_scale
+        _basis_cache[key] = basis
+        if len(_basis_cache) > _BASIS_CACHE_MAX:
+            _basis_cache.popitem(last=False)
+    else:
+        _basis_cache.move_to_end(key)
+    return basis
+
+
+def _row_gross_gex_into_py(out, gamma, open_interest, spot, multiplier, gamma_scale):
+    """Pure-NumPy fallback for row_gross_gex_into (same contract)."""
+    np.multiply(gamma, open_interest, out=out)
+    out *= multiplier * gamma_scale * spot * spot
+    return float(out.sum())
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def row_gross_gex_into(out, gamma, open_interest, spot, multiplier, gamma_scale):
+        """
+        Per-row gross GEX written into a caller-supplied buffer, plus its sum.
+
+        One fused map+reduce pass: no intermediate arrays, and callers that
+        reuse `out` across snapshots (e.g. GrossGEX) skip per-snapshot
+        allocation entirely.
+        """
+        scale = multiplier * gamma_scale * spot * spot
+        total = 0.0
+        for i in range(gamma.shape[0]):
+            value = gamma[i] * open_interest[i] * scale
+            out[i] = value
+            total += value
+        return total
+else:
+    row_gross_gex_into = _row_gross_gex_into_py
+
 
 def row_gross_gex(df, spot, multiplier, gamma_scale):
     """
@@ -16,9 +73,12 @@ def row_gross_gex(df, spot, multiplier, gamma_scale):
         gamma_scale: Scaling factor for gamma units (e.g., 0.01)
 
     Returns:
-        Series of gross gamma exposure values per row
+        Array of gross gamma exposure values per row
     """
-    return df["gamma"] * df["open_interest"] * (spot**2) * multiplier * gamma_scale
+    gamma = df["gamma"].to_numpy(dtype=float)
+    open_interest = df["open_interest"].to_numpy(dtype=float)
+    basis = _spot_invariant_basis(gamma, open_interest, multiplier, gamma_scale)
+    return basis * (spot**2)
 
 
 def apply_dealer_sign(value, dealer_short: bool):
@@ -0,0 +1,352 @@
+"""Shared option chain CSV loading for date-windowed GEX charts."""
+
+import functools
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Copy-on-write keeps the filtered chain a view until a column is written.
+pd.options.mode.copy_on_write = True
+
+try:
+    # Optional: multi-threaded CSV parsing + parquet snapshot caching.
+    import pyarrow.parquet
+
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = None
+
+# Working dtype for chain numeric columns. Strikes, OI, and per-contract
+# greeks all fit float32 exactly enough for the exposure sums we compute;
+# halving element width halves DRAM traffic on the memory-bound
+# aggregations. Reductions still accumulate in float64.
+DTYPE = np.float32
+
+# Columns the GEX/greek pipelines actually consume; snapshot CSVs carry
+# dozens more that never leave the parser.
+CHAIN_COLUMNS = (
+    "contract_type",
+    "expiration_date",
+    "strike",
+    "open_interest",
+    "gamma",
+    "underlying_price",
+    "theoretical_volatility",
+)
+GREEK_COLUMNS = CHAIN_COLUMNS + ("vega", "theta")
+SNAPSHOT_COLUMNS = (
+    "contract_type",
+    "strike",
+    "gamma",
+    "open_interest",
+    "underlying_price",
+)
+
+
+def downcast_chain(df, columns=("strike", "gamma", "open_interest", "underlying_price")):
+    """Downcast numeric chain columns to the working DTYPE, in place."""
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].astype(DTYPE, copy=False)
+    return df
+
+
+def _cache_path_for(csv_file):
+    """Parquet cache location for a snapshot CSV: {data_dir}/.cache/{stem}.parquet."""
+    return csv_file.parent / ".cache" / f"{csv_file.stem}.parquet"
+
+
+def clear_chain_cache(data_dir):
+    """Delete all cached parquet snapshots under data_dir/.cache."""
+    cache_dir = Path(data_dir) / ".cache"
+    if cache_dir.is_dir():
+        for entry in cache_dir.glob("*.parquet"):
+            entry.unlink(missing_ok=True)
+
+
+def _read_chain_csv(csv_file, usecols, use_cache):
+    """Uncached body of read_chain_csv."""
+    cache_path = _cache_path_for(csv_file) if use_cache and _CSV_ENGINE is not None else None
+
+    if cache_path is not None and cache_path.is_file():
+        if cache_path.stat().st_mtime >= csv_file.stat().st_mtime:
+            columns = None
+            if usecols is not None:
+                names = pyarrow.parquet.read_schema(cache_path).names
+                columns = [col for col in usecols if col in names]
+            return pd.read_parquet(cache_path, columns=columns)
+
+    if cache_path is not None:
+        # Cache miss: parse the full file once so the cache can serve any
+        # column projection, then project in-memory for this caller.
+        df = pd.read_csv(csv_file, engine=_CSV_ENGINE)
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+        except OSError:
+            pass  # read-only data_dir: just skip the cache
+        if usecols is not None:
+            df = df[[col for col in usecols if col in df.columns]]
+        return df
+
+    kwargs = {}
+    if _CSV_ENGINE is not None:
+        kwargs["engine"] = _CSV_ENGINE
+    if usecols is not None:
+        header = pd.read_csv(csv_file, nrows=0).columns
+        kwargs["usecols"] = [col for col in usecols if col in header]
+    return pd.read_csv(csv_file, **kwargs)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_chain_csv_cached(path, mtime_ns, usecols, use_cache):
+    return _read_chain_csv(Path(path), usecols, use_cache)
+
+
+def read_chain_csv(csv_file, usecols=None, use_cache=True):
+    """
+    Read an option chain snapshot CSV, projecting to the needed columns.
+
+    Uses the multi-threaded pyarrow parser when pyarrow is installed and
+    skips parsing columns outside usecols, which cuts both parse time and
+    peak memory on wide chain files.
+
+    When pyarrow is available the parsed frame is also persisted to
+    {data_dir}/.cache/{stem}.parquet; warm reloads (e.g. intraday re-runs of
+    the snapshot charts) then read compressed columnar parquet instead of
+    re-parsing the CSV. The cache is invalidated whenever the CSV is newer.
+
+    Parsed frames are additionally memoized in-process keyed by
+    (path, mtime, usecols), so chart classes re-instantiated on every
+    Streamlit rerun skip the parse entirely while the file is unchanged.
+
+    Args:
+        csv_file: Path to the CSV file
+        usecols: Optional iterable of column names to keep; names missing
+                 from the file are ignored
+        use_cache: Read/write the parquet cache (default: True)
+
+    Returns:
+        DataFrame with the projected columns
+    """
+    csv_file = Path(csv_file)
+    if usecols is not None:
+        usecols = tuple(usecols)
+    try:
+        mtime_ns = csv_file.stat().st_mtime_ns
+    except OSError:
+        return _read_chain_csv(csv_file, usecols, use_cache)
+    df = _read_chain_csv_cached(str(csv_file), mtime_ns, usecols, use_cache)
+    # Shallow copy under copy-on-write: callers mutate their own frame
+    # without touching the memoized original, at zero upfront cost.
+    return df.copy(deep=False)
+
+
+# Snapshot filename format: {symbol}_exp{expiration}_{fetch_date}_{fetch_time}.csv
+_FILE_RE = re.compile(
+    r"^(?P<sym>.+?)_exp(?P<exp>\d{4}-\d{2}-\d{2})"
+    r"_(?P<date>\d{4}-\d{2}-\d{2})_(?P<time>\d{2}-\d{2}-\d{2})\.csv$"
+)
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_fetch_dt(date_part, time_part):
+    """
+    Parse a fetch timestamp from its filename date/time parts.
+
+    fromisoformat skips strptime's per-call format-string parsing, and the
+    cache pays off because the same fetch (date, time) pair repeats across
+    every expiration captured in that snapshot pass.
+    """
+    return datetime.fromisoformat(f"{date_part}T{time_part.replace('-', ':')}")
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_chain_filename(name):
+    """
+    Parse an option chain snapshot filename.
+
+    Cached so repeated discovery passes over the same directory skip the
+    regex and datetime work after the first scan.
+
+    Args:
+        name: Filename like 'SPXW_exp2025-12-24_2025-12-18_14-30-00.csv'
+
+    Returns:
+        tuple: (symbol, expiration datetime, fetch datetime),
+               or None if the name does not match the snapshot format
+    """
+    match = _FILE_RE.match(name)
+    if match is None:
+        return None
+
+    exp_date = datetime.fromisoformat(match.group("exp"))
+    fetch_dt = _parse_fetch_dt(match.group("date"), match.group("time"))
+    return match.group("sym"), exp_date, fetch_dt
+
+
+def scan_chain_files(data_dir):
+    """
+    List CSV files in data_dir with one os.scandir pass, sorted by name.
+
+    Args:
+        data_dir: Directory containing option chain CSV files (str or Path)
+
+    Returns:
+        list of Path objects for every .csv entry in the directory
+    """
+    return sorted(
+        (Path(entry.path) for entry in os.scandir(data_dir) if entry.name.endswith(".csv")),
+        key=lambda p: p.name,
+    )
+
+
+def scan_chain_metadata(data_dir):
+    """
+    Parse every snapshot filename in data_dir in one vectorized pass.
+
+    Extracts all fields with a single .str.extract over the stems and one
+    pd.to_datetime call (C parser, repeated-date cache) instead of a
+    per-file Python regex + strptime loop, which dominates discovery time
+    on directories with thousands of snapshots.
+
+    Args:
+        data_dir: Directory containing option chain CSV files (str or Path)
+
+    Returns:
+        DataFrame sorted by filename with columns:
+            file (Path), symbol (str), expiration (Timestamp), fetch_dt (Timestamp)
+        Non-matching filenames are dropped.
+    """
+    csv_files = scan_chain_files(data_dir)
+    stems = pd.Series([p.stem for p in csv_files], dtype=object)
+    meta = stems.str.extract(
+        r"^(?P<symbol>.+?)_exp(?P<exp>\d{4}-\d{2}-\d{2})"
+        r"_(?P<date>\d{4}-\d{2}-\d{2})_(?P<time>\d{2}-\d{2}-\d{2})$"
+    )
+    meta["file"] = csv_files
+    meta = meta.dropna(subset=["symbol"])
+
+    meta["expiration"] = pd.to_datetime(meta.pop("exp"), format="%Y-%m-%d", cache=True)
+    meta["fetch_dt"] = pd.to_datetime(
+        meta.pop("date") + "_" + meta.pop("time"), format="%Y-%m-%d_%H-%M-%S", cache=True
+    )
+    return meta
+
+
+@functools.lru_cache(maxsize=8)
+def load_option_chains(symbol, start_date, days_out, data_dir):
+    """
+    Load the latest option chain snapshot per expiration within a date window.
+
+    Finds CSV files named {symbol}_exp{expiration}_{fetch_date}_{fetch_time}.csv,
+    keeps the most recent snapshot per expiration between start_date and
+    start_date + days_out, and standardizes the columns used by the GEX charts
+    (expiration_dt, T, iv, K, OI).
+
+    Results are memoized so charts rendered side-by-side (e.g. GEXPrice and
+    GEXStrike in the dashboard) share a single glob + parse + read_csv pass.
+
+    Args:
+        symbol: The ticker symbol (e.g., 'SPXW', 'SPX')
+        start_date: Start date as string 'YYYY-MM-DD'
+        days_out: Number of calendar days to include expirations
+        data_dir: Directory containing option chain CSV files (str or Path)
+
+    Returns:
+        tuple: (all_opts, asof, spot) where all_opts is the standardized
+               DataFrame, asof is the earliest fetch datetime across the
+               selected files, and spot is the underlying price
+
+    Raises:
+        ValueError: If no matching files or expirations are found
+    """
+    data_dir = Path(data_dir)
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    end_dt = start_dt + timedelta(days=days_out)
+
+    meta = scan_chain_metadata(data_dir)
+    meta = meta[meta["symbol"] == symbol]
+    if meta.empty:
+        raise ValueError(f"No option chain CSV files found for symbol {symbol} in {data_dir}")
+
+    meta = meta[(meta["expiration"] >= start_dt) & (meta["expiration"] <= end_dt)]
+    if meta.empty:
+        raise ValueError(
+            f"No option chain files found with expirations between {start_date} "
+            f"and {end_dt.strftime('%Y-%m-%d')}"
+        )
+
+    # Latest snapshot per expiration, picked vectorized
+    latest = meta.loc[meta.groupby("expiration")["fetch_dt"].idxmax()]
+    latest_files = list(latest["file"])
+    asof = latest["fetch_dt"].min().to_pydatetime()
+
+    dfs = []
+    for csv_file in latest_files:
+        df_temp = read_chain_csv(csv_file, usecols=CHAIN_COLUMNS)
+        if not df_temp.empty:
+            dfs.append(df_temp)
+
+    # IV: use theoretical_volatility, convert percent -> decimal
+    if not any("theoretical_volatility" in d.columns for d in dfs):
+        raise ValueError("Expected theoretical_volatility column for IV input.")
+
+    # Only a fixed set of columns is used downstream, so fill preallocated
+    # per-column arrays slice by slice instead of pd.concat'ing every file's
+    # full frame (which copies all rows a second time).
+    total = sum(len(d) for d in dfs)
+    contract_type = np.empty(total, dtype=object)
+    expiration = np.empty(total, dtype="datetime64[ns]")
+    strike = np.empty(total, dtype=float)
+    open_interest = np.empty(total, dtype=float)
+    iv_pct = np.empty(total, dtype=float)
+    gamma = np.full(total, np.nan)
+    underlying = np.full(total, np.nan)
+
+    pos = 0
+    for d in dfs:
+        rows = slice(pos, pos + len(d))
+        contract_type[rows] = d["contract_type"].to_numpy()
+        expiration[rows] = pd.to_datetime(d["expiration_date"]).to_numpy()
+        strike[rows] = pd.to_numeric(d["strike"], errors="coerce").to_numpy()
+        open_interest[rows] = pd.to_numeric(d["open_interest"], errors="coerce").to_numpy()
+        iv_pct[rows] = pd.to_numeric(d["theoretical_volatility"], errors="coerce").to_numpy()
+        if "gamma" in d.columns:
+            gamma[rows] = pd.to_numeric(d["gamma"], errors="coerce").to_numpy()
+        if "underlying_price" in d.columns:
+            underlying[rows] = pd.to_numeric(d["underlying_price"], errors="coerce").to_numpy()
+        pos += len(d)
+
+    all_opts = pd.DataFrame(
+        {
+            "contract_type": contract_type,
+            "strike": strike,
+            "open_interest": open_interest,
+            "gamma": gamma,
+            "underlying_price": underlying,
+        }
+    )
+
+    # NOTE: convert the expiration date to a datetime when trading stops:
+    # Add 15 hours and 15 minutes. Assumes 3 PM CT expiry.
+    all_opts["expiration_dt"] = pd.Series(expiration) + pd.Timedelta(hours=15, minutes=15)
+
+    # Time to expiry in years, floored at ~1 minute
+    all_opts["T"] = (all_opts["expiration_dt"] - asof).dt.total_seconds() / (365.0 * 24 * 3600)
+    all_opts["T"] = all_opts["T"].clip(lower=(5.0 / (365.0 * 24 * 60)))
+
+    all_opts["iv"] = iv_pct / 100.0
+    all_opts["K"] = strike
+    all_opts["OI"] = open_interest
+
+    all_opts = all_opts.dropna(subset=["iv", "K", "OI", "T"])
+    all_opts = all_opts[(all_opts["iv"] > 0) & (all_opts["OI"] > 0)]
+
+    spot = float(pd.to_numeric(all_opts["underlying_price"], errors="coerce").dropna().iloc[0])
+
+    return all_opts, asof, spot
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+import src.utils.option_chain_loader  # noqa: F401  enables pandas copy-on-write globally
+from src.indicators.hedge_flow_score import calculate_hfs, interpret_hfs
+
+
+def make_chain(call_oi=100, put_oi=100):
+    return pd.DataFrame({
+        "strike": [4990.0, 5000.0, 5010.0, 4990.0, 5000.0, 5010.0],
+        "gamma": [0.01, 0.02, 0.01, 0.01, 0.02, 0.01],
+        "open_interest": [call_oi] * 3 + [put_oi] * 3,
+        "underlying_price": [5000.0] * 6,
+        "contract_type": ["CALL"] * 3 + ["PUT"] * 3,
+    })
+
+
+def test_calculate_hfs_under_copy_on_write():
+    # option_chain_loader turns on copy-on-write, so to_numpy() hands the
+    # kernel read-only arrays; this must not raise
+    hfs = calculate_hfs(make_chain())
+    assert -1.0 <= hfs <= 1.0
+
+
+def test_calculate_hfs_balanced_chain_is_neutral():
+    assert calculate_hfs(make_chain(call_oi=100, put_oi=100)) == 0.0
+
+
+def test_calculate_hfs_call_heavy_chain_sign():
+    # Dealers short gamma (default -1): call-dominated gamma gives a
+    # negative score, and flipping the dealer sign flips the score
+    hfs = calculate_hfs(make_chain(call_oi=300, put_oi=100))
+    assert hfs < 0
+    assert calculate_hfs(make_chain(call_oi=300, put_oi=100), dealer_position=1) == -hfs
+
+
+def test_calculate_hfs_empty_frame():
+    df = make_chain().iloc[0:0]
+    assert calculate_hfs(df) == 0.0
+
+
+def test_calculate_hfs_missing_columns():
+    df = make_chain().drop(columns=["gamma"])
+    with pytest.raises(ValueError, match="gamma"):
+        calculate_hfs(df)
+
+
+def test_interpret_hfs_regimes():
+    assert interpret_hfs(0.5)["regime"] == "Mean Reversion / Pinning"
+    assert interpret_hfs(-0.5)["regime"] == "Acceleration / Breakout"
+    assert interpret_hfs(0.0)["regime"] == "Fragile / Chop / Tape-Driven"